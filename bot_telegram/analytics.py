@@ -0,0 +1,78 @@
+import numpy as np
+
+NS_PER_DAY = 86400 * 10 ** 9
+NS_PER_WEEK = 7 * NS_PER_DAY
+# Periods start at midnight UTC, weeks on a Monday: the epoch was a Thursday, 1970-01-05 a Monday
+PERIOD_ORIGIN_NS = 4 * NS_PER_DAY
+TOP_EARNERS = 5
+VOLUME_PERCENTILES = (50, 90, 99)
+
+
+def forward_columns(rows):
+    # One array per field of the store's forward rows, in FORWARD_COLUMNS order
+    rows = rows.fetchall() if hasattr(rows, 'fetchall') else list(rows)
+    if rows:
+        timestamps, _, chan_ids_out, amts_in, amts_out, fees, _, aliases_out = zip(*rows)
+    else:
+        timestamps = chan_ids_out = amts_in = amts_out = fees = aliases_out = ()
+    return {
+        'timestamp_ns': np.array(timestamps, dtype=np.int64),
+        'chan_id_out': np.array(chan_ids_out, dtype=np.uint64),
+        'amt_in_msat': np.array(amts_in, dtype=np.int64),
+        'amt_out_msat': np.array(amts_out, dtype=np.int64),
+        'fee_msat': np.array(fees, dtype=np.int64),
+        # Live forwards carry no alias, they are attributed to the outgoing channel
+        'peer': np.array([alias or str(chan_id) for alias, chan_id in zip(aliases_out, chan_ids_out)], dtype=object),
+    }
+
+
+def fee_rate_ppm(fee_msat, amt_msat):
+    fee_msat = np.asarray(fee_msat, dtype=np.float64)
+    amt_msat = np.asarray(amt_msat, dtype=np.float64)
+    return np.divide(fee_msat * 1e6, amt_msat, out=np.zeros_like(fee_msat), where=amt_msat > 0)
+
+
+def group_sums(keys, *values):
+    # groupby-sum: factorize the keys once, then one bincount per value column
+    labels, inverse = np.unique(keys, return_inverse=True)
+    return labels, [np.bincount(inverse, weights=value, minlength=len(labels)) for value in values]
+
+
+class RoutingStats:
+    """Routing revenue aggregates over a set of forwards.
+
+    Sums are computed per outgoing channel, per outgoing peer and per period
+    (UTC days or weeks from Monday, by period_ns), together with overall totals, fee
+    rates in ppm and percentiles of the forwarded amounts.
+    """
+
+    def __init__(self, columns, period_ns=NS_PER_DAY, top=TOP_EARNERS):
+        amt_out = columns['amt_out_msat']
+        fees = columns['fee_msat']
+        self.count = len(fees)
+        self.volume_msat = int(amt_out.sum())
+        self.fees_msat = int(fees.sum())
+        self.fee_rate_ppm = float(fee_rate_ppm(self.fees_msat, self.volume_msat))
+        if self.count:
+            self.volume_percentiles = dict(zip(VOLUME_PERCENTILES,
+                                               np.percentile(columns['amt_in_msat'], VOLUME_PERCENTILES).tolist()))
+        else:
+            self.volume_percentiles = {}
+
+        self.top_channels = self._top(columns['chan_id_out'], amt_out, fees, top)
+        self.top_peers = self._top(columns['peer'], amt_out, fees, top)
+
+        # Periods are labelled by their start, oldest first
+        periods, (volume, period_fees) = group_sums((columns['timestamp_ns'] - PERIOD_ORIGIN_NS) // period_ns,
+                                                    amt_out, fees)
+        self.periods = list(zip((periods * period_ns + PERIOD_ORIGIN_NS).tolist(), volume.astype(np.int64).tolist(),
+                                period_fees.astype(np.int64).tolist()))
+
+    @staticmethod
+    def _top(keys, amt_out, fees, top):
+        # (key, volume_msat, fees_msat, ppm) of the keys that earned the most fees
+        labels, (volume, key_fees) = group_sums(keys, amt_out, fees)
+        order = np.argsort(key_fees, kind='stable')[::-1][:top]
+        return list(zip(labels[order].tolist(), volume[order].astype(np.int64).tolist(),
+                        key_fees[order].astype(np.int64).tolist(),
+                        fee_rate_ppm(key_fees[order], volume[order]).tolist()))
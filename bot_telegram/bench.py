@@ -0,0 +1,299 @@
+import os
+import sys
+import json
+import time
+import asyncio
+import logging
+import argparse
+import platform
+import resource
+import tempfile
+import tracemalloc
+import subprocess
+from datetime import datetime, timezone
+
+# Node sizes as channels:forwards; invoices, payments and transactions scale with the forwards
+DEFAULT_SIZES = '10:1000,500:10000,5000:100000'
+DEFAULT_ITERATIONS = 50
+
+# What each mode clears before every timed tap:
+#   warm      nothing, the caches were filled by an untimed tap
+#   uncached  the view cache, coalesced results and channel snapshots, as for a tap on data that moved
+#   cold      also the gRPC channel, the in-memory channel mirror and on-chain watcher and the store's
+#             connection, as for the first tap after a restart (the store's contents on disk are kept)
+MODES = ('cold', 'uncached', 'warm')
+
+# Button callback data of every menu handler benchmarked, Bitcoin Info is left out as it
+# only measures the external HTTP APIs
+HANDLERS = [
+    'nodeinfo',
+    'channelinfo',
+    'channels:local:1',
+    'recenttransactions',
+    'forwardingtransactions',
+    'routingstats:30',
+    'routingstats:365',
+]
+
+
+class FakeMessage:
+    """Telegram message stand-in that counts what the bot sends instead of sending it."""
+
+    def __init__(self, latency=0.0):
+        self.chat_id = 1
+        self.latency = latency
+        self.messages = 0
+        self.bytes = 0
+
+    async def reply_text(self, text, **kwargs):
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        self.messages += 1
+        self.bytes += len(text.encode())
+        return self
+
+
+class FakeQuery:
+    def __init__(self, data, message):
+        self.data = data
+        self.message = message
+
+    async def answer(self):
+        pass
+
+    async def edit_message_text(self, text, **kwargs):
+        return await self.message.reply_text(text, **kwargs)
+
+
+class FakeUpdate:
+    def __init__(self, query):
+        self.callback_query = query
+
+
+def percentile(values, p):
+    values = sorted(values)
+    if not values:
+        return None
+    k = (len(values) - 1) * p / 100
+    low = int(k)
+    high = min(low + 1, len(values) - 1)
+    return values[low] + (values[high] - values[low]) * (k - low)
+
+
+def peak_rss_kb():
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def rss_kb():
+    # Current (not peak) resident set size, where /proc is available
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * resource.getpagesize() // 1024
+    except OSError:
+        return None
+
+
+async def peak_alloc_kb(tap):
+    # Peak of the memory allocated while tap runs, on top of what was allocated before it.
+    # tracemalloc slows allocations down, so this is measured on an extra, untimed tap.
+    tracemalloc.start()
+    try:
+        await tap()
+        return tracemalloc.get_traced_memory()[1] // 1024
+    finally:
+        tracemalloc.stop()
+
+
+def rpc_bytes():
+    # Unary responses and stream messages received from LND, all nodes and methods
+    from metrics import RPC_RESPONSE_SIZE, RPC_STREAM_BYTES
+    return (sum(total for _, total in RPC_RESPONSE_SIZE.totals().values())
+            + sum(RPC_STREAM_BYTES.totals().values()))
+
+
+async def wait_synced(node, data, timeout=300):
+    # The monitors catch the store up on subscription; wait until it holds the whole fake history
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        store = node.store
+        if (store.get_cursor('forwards') >= len(data.forwards)
+                and store.get_cursor('invoice_add_index') >= len(data.invoices)
+                and node.channel_mirror.synced_at is not None):
+            return
+        await asyncio.sleep(0.1)
+    raise TimeoutError(f"Node {node.name} did not sync within {timeout}s")
+
+
+async def bench_size(channels, forwards, iterations, latency, telegram_latency, data_dir):
+    # Import the bot only now, with its configuration pointed away from any real node
+    import lightning_bot as bot
+    from fake_lnd import FakeLnd, FakeNodeData
+    from nodes import Node
+    from channels import ChannelBrowser, ChannelMirror
+    from onchain import OnchainWatcher, RecentOnchain
+    from store import Store
+    from throttle import SingleFlight, RateLimiter
+    from view_cache import ViewCache
+
+    setup_start = time.perf_counter()
+    data = FakeNodeData(channels=channels, forwards=forwards, invoices=max(forwards // 10, 10),
+                        payments=max(forwards // 20, 10), transactions=max(forwards // 100, 10))
+    lnd = FakeLnd(data, latency=latency)
+    address = await lnd.start()
+    store_path = os.path.join(data_dir, f'bench-{channels}-{forwards}.db')
+    node = Node('bench', address, None, os.devnull, store_path)
+    bot.nodes = [node]
+    # Every tap is let through, throttling would only measure the rate limiter
+    bot.rate_limiter = RateLimiter(rate=1e9, burst=1e9)
+    node.start()
+    try:
+        await wait_synced(node, data)
+        # With the history stored, the monitors are stopped so no stream traffic runs alongside the taps
+        for monitor in node.monitors:
+            await monitor.stop()
+        setup = time.perf_counter() - setup_start
+        sync_bytes = rpc_bytes()
+
+        async def clear(mode):
+            if mode == 'cold':
+                await node.channel.close()
+                node.channel_mirror = ChannelMirror(node.get_stub)
+                node.store.close()
+                node.store = Store(store_path)
+                # A restarted watcher has no synced height yet, so its first read scans by height again
+                node.onchain_watcher = OnchainWatcher(node.get_stub, RecentOnchain(store=node.store))
+            bot.view_cache = ViewCache()
+            bot.flights = SingleFlight()
+            bot.channel_browser = ChannelBrowser(bot.nodes, timeout=bot.NODE_TIMEOUT)
+
+        results = []
+        for handler in HANDLERS:
+            for mode in MODES:
+                await clear(mode)
+                if mode == 'warm':
+                    await bot.button(FakeUpdate(FakeQuery(handler, FakeMessage())), None)
+                message = FakeMessage(telegram_latency)
+                latencies = []
+                rpc_total = 0
+                rss_start = rss_kb()
+                for _ in range(iterations):
+                    if mode != 'warm':
+                        await clear(mode)
+                    rpc_start = rpc_bytes()
+                    start = time.perf_counter()
+                    await bot.button(FakeUpdate(FakeQuery(handler, message)), None)
+                    latencies.append(time.perf_counter() - start)
+                    rpc_total += rpc_bytes() - rpc_start
+                rss_end = rss_kb()
+                if mode != 'warm':
+                    await clear(mode)
+                peak_kb = await peak_alloc_kb(lambda: bot.button(FakeUpdate(FakeQuery(handler, FakeMessage())), None))
+                results.append({
+                    'handler': handler,
+                    'mode': mode,
+                    'iterations': iterations,
+                    'p50_ms': percentile(latencies, 50) * 1000,
+                    'p95_ms': percentile(latencies, 95) * 1000,
+                    'p99_ms': percentile(latencies, 99) * 1000,
+                    'max_ms': max(latencies) * 1000,
+                    'rpc_bytes_per_call': rpc_total / iterations,
+                    'telegram_bytes_per_call': message.bytes / iterations,
+                    'telegram_messages_per_call': message.messages / iterations,
+                    'peak_alloc_kb': peak_kb,
+                    'rss_growth_kb': rss_end - rss_start if rss_start is not None else None,
+                })
+                logging.info(f"{channels} channels, {forwards} forwards, {handler} ({mode}): "
+                             f"p50 {results[-1]['p50_ms']:.2f} ms, p99 {results[-1]['p99_ms']:.2f} ms")
+        return {
+            'channels': channels,
+            'forwards': forwards,
+            'invoices': len(data.invoices),
+            'payments': len(data.payments),
+            'transactions': len(data.transactions),
+            'setup_s': setup,
+            'sync_rpc_bytes': sync_bytes,
+            'peak_rss_kb': peak_rss_kb(),
+            'handlers': results,
+        }
+    finally:
+        await node.stop()
+        await lnd.stop()
+
+
+def run_child(args):
+    # One node size in this process, so its peak RSS isn't inherited from a bigger size
+    channels, forwards = (int(n) for n in args.size.split(':'))
+    result = asyncio.run(bench_size(channels, forwards, args.iterations, args.latency,
+                                    args.telegram_latency, args.data_dir))
+    with open(args.child_output, 'w') as f:
+        json.dump(result, f)
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(args):
+    results = []
+    with tempfile.TemporaryDirectory() as data_dir:
+        for size in args.sizes.split(','):
+            child_output = os.path.join(data_dir, f'{size.replace(":", "-")}.json')
+            subprocess.run([sys.executable, os.path.abspath(__file__), '--size', size,
+                            '--iterations', str(args.iterations), '--latency', str(args.latency),
+                            '--telegram-latency', str(args.telegram_latency),
+                            '--data-dir', data_dir, '--child-output', child_output], check=True)
+            with open(child_output) as f:
+                results.append(json.load(f))
+
+    report = {
+        'commit': git_commit(),
+        'date': datetime.now(timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'iterations': args.iterations,
+        'rpc_latency_s': args.latency,
+        'telegram_latency_s': args.telegram_latency,
+        'sizes': results,
+    }
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+
+    print(f"{'channels':>8} {'forwards':>8} {'handler':<24} {'mode':<8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} "
+          f"{'RPC B':>10} {'TG B':>8} {'Peak MB':>8}")
+    for size in results:
+        for r in size['handlers']:
+            print(f"{size['channels']:>8} {size['forwards']:>8} {r['handler']:<24} {r['mode']:<8} "
+                  f"{r['p50_ms']:>9.2f} {r['p95_ms']:>9.2f} {r['p99_ms']:>9.2f} "
+                  f"{r['rpc_bytes_per_call']:>10.0f} {r['telegram_bytes_per_call']:>8.0f} {r['peak_alloc_kb'] / 1024:>8.1f}")
+    print(f"Results written to {args.output}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark every menu handler against a fake LND node.")
+    parser.add_argument('--sizes', default=DEFAULT_SIZES, help="Comma separated channels:forwards node sizes")
+    parser.add_argument('--iterations', type=int, default=DEFAULT_ITERATIONS)
+    parser.add_argument('--latency', type=float, default=0.0, help="Seconds added to every fake LND call")
+    parser.add_argument('--telegram-latency', type=float, default=0.0, help="Seconds added to every reply")
+    parser.add_argument('--output', default='bench-results.json')
+    parser.add_argument('--size', help=argparse.SUPPRESS)
+    parser.add_argument('--data-dir', help=argparse.SUPPRESS)
+    parser.add_argument('--child-output', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    # The bot reads its configuration on import: no real node, no metrics port, stores in the temp dir
+    os.environ.update({'LND_NODES': '[]', 'METRICS_ADDR': '', 'DATA_DIR': args.data_dir or tempfile.gettempdir()})
+    logging.basicConfig(level=logging.WARNING, format='%(asctime)s - %(levelname)s - %(message)s')
+    if args.size:
+        run_child(args)
+    else:
+        run(args)
+
+
+if __name__ == '__main__':
+    main()
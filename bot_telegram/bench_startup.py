@@ -0,0 +1,107 @@
+import os
+import sys
+import json
+import argparse
+import platform
+import statistics
+import subprocess
+import tempfile
+from datetime import datetime, timezone
+
+from bench import git_commit
+
+DEFAULT_RUNS = 10
+# Modules that are expensive to load, reported as loaded or not after the bot is imported
+HEAVY_MODULES = ['grpc', 'google.protobuf', 'lightning_pb2', 'router_pb2', 'telegram', 'httpx', 'psutil', 'numpy']
+
+# Run in a fresh interpreter for every sample, so nothing is already imported or cached in memory
+CHILD = """
+import sys, json, time, resource
+start = time.perf_counter()
+import lightning_bot
+elapsed = time.perf_counter() - start
+peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+try:
+    with open('/proc/self/statm') as f:
+        rss = int(f.read().split()[1]) * resource.getpagesize() // 1024
+except OSError:
+    rss = None
+print(json.dumps({
+    'import_s': elapsed,
+    'peak_rss_kb': peak // 1024 if sys.platform == 'darwin' else peak,
+    'rss_kb': rss,
+    'loaded': sorted(name for name in %r if name in sys.modules),
+}))
+"""
+
+
+def parse_importtime(stderr):
+    # "import time: self [us] | cumulative | imported package" lines, indented by nesting depth
+    cumulative = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, total, name = line[len('import time:'):].split('|')
+        cumulative[name.strip()] = int(total) / 1e6
+    return cumulative
+
+
+def sample(env):
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', CHILD % (HEAVY_MODULES,)],
+                            capture_output=True, text=True, env=env,
+                            cwd=os.path.dirname(os.path.abspath(__file__)), check=True)
+    run = json.loads(result.stdout.strip().splitlines()[-1])
+    run['modules_s'] = parse_importtime(result.stderr)
+    return run
+
+
+def run(args):
+    with tempfile.TemporaryDirectory() as data_dir:
+        # The bot reads its configuration on import: no node, no metrics port, stores in the temp dir
+        env = dict(os.environ, LND_NODES='[]', METRICS_ADDR='', DATA_DIR=data_dir)
+        runs = [sample(env) for _ in range(args.runs)]
+
+    modules = {}
+    for name in runs[0]['modules_s']:
+        times = [r['modules_s'][name] for r in runs if name in r['modules_s']]
+        modules[name] = statistics.median(times)
+    slowest = sorted(modules.items(), key=lambda item: item[1], reverse=True)[:args.top]
+    rss = [r['rss_kb'] for r in runs if r['rss_kb'] is not None]
+
+    report = {
+        'commit': git_commit(),
+        'date': datetime.now(timezone.utc).isoformat(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'runs': args.runs,
+        'import_s_median': statistics.median(r['import_s'] for r in runs),
+        'import_s_min': min(r['import_s'] for r in runs),
+        'peak_rss_kb_median': statistics.median(r['peak_rss_kb'] for r in runs),
+        'rss_kb_median': statistics.median(rss) if rss else None,
+        'loaded': runs[0]['loaded'],
+        'slowest_imports_s': dict(slowest),
+    }
+    with open(args.output, 'w') as f:
+        json.dump(report, f, indent=2)
+
+    print(f"Import time: {report['import_s_median'] * 1000:.1f} ms median, {report['import_s_min'] * 1000:.1f} ms min")
+    print(f"Peak RSS: {report['peak_rss_kb_median'] / 1024:.1f} MB"
+          + (f", RSS after import: {report['rss_kb_median'] / 1024:.1f} MB" if rss else ""))
+    print(f"Loaded at startup: {', '.join(report['loaded']) or 'none'}")
+    print(f"Not loaded until used: {', '.join(name for name in HEAVY_MODULES if name not in report['loaded'])}")
+    print("Slowest imports (cumulative):")
+    for name, seconds in slowest:
+        print(f"   {seconds * 1000:8.1f} ms  {name}")
+    print(f"Results written to {args.output}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the bot's import time and baseline memory.")
+    parser.add_argument('--runs', type=int, default=DEFAULT_RUNS)
+    parser.add_argument('--top', type=int, default=15, help="Number of slowest imports to report")
+    parser.add_argument('--output', default='bench-startup.json')
+    run(parser.parse_args())
+
+
+if __name__ == '__main__':
+    main()
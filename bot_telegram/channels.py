@@ -0,0 +1,180 @@
+import time
+import asyncio
+import logging
+from lightning_pb2 import ListChannelsRequest, ChannelEventSubscription, ChannelEventUpdate
+from monitor import StreamMonitor
+
+# Channel events don't carry balance changes from payments and forwards, so the
+# mirror is re-read from ListChannels in the background once it is this old.
+CHANNEL_RESYNC_INTERVAL = 300
+
+CHANNELS_PER_PAGE = 10
+CHANNEL_SNAPSHOT_TTL = 60
+
+# Orderings offered by the channel browser, each paired with its button label
+CHANNEL_SORTS = {
+    'capacity': ("Capacity", lambda channel: -channel.capacity),
+    'local': ("Local %", lambda channel: -(channel.local_balance / channel.capacity if channel.capacity else 0)),
+    # Inactive channels first, then the ones with the worst uptime
+    'inactive': ("Inactivity", lambda channel: (channel.active,
+                                                channel.uptime / channel.lifetime if channel.lifetime else 1.0)),
+}
+
+
+def channel_point_str(point):
+    # Same "txid:index" form as Channel.channel_point; funding_txid_bytes is little-endian
+    txid = point.funding_txid_str or point.funding_txid_bytes[::-1].hex()
+    return f"{txid}:{point.output_index}"
+
+
+class ChannelMirror(StreamMonitor):
+    """In-memory copy of the node's channels kept current by SubscribeChannelEvents.
+
+    Bootstraps from ListChannels on every (re)subscription, then applies open,
+    close, active and inactive events to an index keyed by chan_id.
+    version is bumped on every change so readers can tell when data moved.
+    """
+
+    name = 'channel'
+
+    def __init__(self, get_stub, notify=None, resync_interval=CHANNEL_RESYNC_INTERVAL):
+        super().__init__(get_stub)
+        self.notify = notify
+        self.resync_interval = resync_interval
+        self.channels = {}  # chan_id -> Channel
+        self.version = 0
+        self.synced_at = None
+        self._points = {}  # channel point -> chan_id
+        self._resync_task = None
+
+    async def get_channels(self, stub=None):
+        if self.synced_at is None:
+            await self.sync(stub or self.get_stub())
+        elif time.monotonic() - self.synced_at > self.resync_interval:
+            self._resync_in_background()
+        return list(self.channels.values())
+
+    async def sync(self, stub):
+        response = await stub.ListChannels(ListChannelsRequest())
+        self.channels = {channel.chan_id: channel for channel in response.channels}
+        self._points = {channel.channel_point: channel.chan_id for channel in response.channels}
+        self.synced_at = time.monotonic()
+        self.version += 1
+
+    async def subscribe(self, stub):
+        # Subscribe before listing so nothing that happens in between is lost
+        stream = stub.SubscribeChannelEvents(ChannelEventSubscription())
+        await self.sync(stub)
+        return stream
+
+    async def handle(self, update):
+        kind = update.type
+        if kind == ChannelEventUpdate.OPEN_CHANNEL:
+            channel = update.open_channel
+            self.channels[channel.chan_id] = channel
+            self._points[channel.channel_point] = channel.chan_id
+            await self._notify(f"🔓 Channel opened with {channel.remote_pubkey}\n"
+                               f"   - Capacity: {channel.capacity} satoshis")
+        elif kind == ChannelEventUpdate.CLOSED_CHANNEL:
+            summary = update.closed_channel
+            self.channels.pop(summary.chan_id, None)
+            self._points.pop(summary.channel_point, None)
+            await self._notify(f"🔒 Channel closed with {summary.remote_pubkey}\n"
+                               f"   - Capacity: {summary.capacity} satoshis\n"
+                               f"   - Settled Balance: {summary.settled_balance} satoshis")
+        elif kind in (ChannelEventUpdate.ACTIVE_CHANNEL, ChannelEventUpdate.INACTIVE_CHANNEL):
+            point = update.active_channel if kind == ChannelEventUpdate.ACTIVE_CHANNEL else update.inactive_channel
+            channel = self.channels.get(self._points.get(channel_point_str(point)))
+            if channel is None:
+                return
+            channel.active = kind == ChannelEventUpdate.ACTIVE_CHANNEL
+        else:
+            return
+        self.version += 1
+
+    def _resync_in_background(self):
+        if self._resync_task is None or self._resync_task.done():
+            self._resync_task = asyncio.get_running_loop().create_task(self._resync())
+
+    async def _resync(self):
+        try:
+            await self.sync(self.get_stub())
+        except Exception as e:
+            details = e.details() if hasattr(e, 'details') else e
+            logging.error(f"Error resyncing channels: {details}")
+
+    async def _notify(self, text):
+        # A failed alert is logged rather than tearing down the stream, which would force a full resync
+        if self.notify is None:
+            return
+        try:
+            await self.notify(text)
+        except Exception as e:
+            logging.error(f"Error sending channel notification: {e}")
+
+
+class ChannelBrowser:
+    """Pages through a sorted snapshot of the channel mirrors of all nodes.
+
+    A snapshot is taken per ordering and reused for page turns until one of the
+    mirrors' versions changes or it is older than the TTL, then it is rebuilt
+    lazily on the next page request. Mirrors are read concurrently, and a node
+    that fails or doesn't answer within the timeout is left out of the snapshot;
+    page turns keep using it while the missing nodes are retried in the background.
+    """
+
+    def __init__(self, nodes, page_size=CHANNELS_PER_PAGE, ttl=CHANNEL_SNAPSHOT_TTL, timeout=None):
+        self.nodes = nodes
+        self.page_size = page_size
+        self.ttl = ttl
+        self.timeout = timeout
+        self._snapshots = {}  # sort -> (mirror versions, taken at, sorted (node name, channel) pairs, unavailable)
+        self._retries = {}  # sort -> task reading the nodes missing from its snapshot
+
+    def version(self):
+        return tuple(node.channel_mirror.version for node in self.nodes)
+
+    async def page(self, sort, page):
+        # The snapshot's (mirror versions, taken at) pair identifies the data a page was cut from
+        version, taken_at, channels, unavailable = await self._snapshot(sort)
+        pages = max((len(channels) + self.page_size - 1) // self.page_size, 1)
+        page = min(max(page, 0), pages - 1)
+        start = page * self.page_size
+        return channels[start:start + self.page_size], page, pages, len(channels), unavailable, (version, taken_at)
+
+    async def _snapshot(self, sort):
+        snapshot = self._snapshots.get(sort)
+        if snapshot is None or snapshot[0] != self.version() or time.monotonic() - snapshot[1] > self.ttl:
+            version = self.version()
+            channels, unavailable = await self._read(self.nodes)
+            snapshot = (version, time.monotonic(), self._sorted(sort, channels), unavailable)
+            self._snapshots[sort] = snapshot
+        elif snapshot[3]:
+            retry = self._retries.get(sort)
+            if retry is None or retry.done():
+                self._retries[sort] = asyncio.get_running_loop().create_task(self._retry(sort, snapshot))
+        return snapshot
+
+    async def _retry(self, sort, snapshot):
+        # Add the nodes that answer now to the snapshot, unless it was replaced in the meantime
+        channels, unavailable = await self._read([node for node in self.nodes if node.name in snapshot[3]])
+        if self._snapshots.get(sort) is snapshot and len(unavailable) < len(snapshot[3]):
+            self._snapshots[sort] = (snapshot[0], time.monotonic(), self._sorted(sort, snapshot[2] + channels),
+                                     unavailable)
+
+    async def _read(self, nodes):
+        # nodes imports this module, so its helpers are only imported once needed
+        from nodes import gather_nodes
+        results = await gather_nodes(nodes, lambda node: node.channel_mirror.get_channels(), self.timeout)
+        channels, unavailable = [], []
+        for node, result in zip(nodes, results):
+            if isinstance(result, Exception):
+                unavailable.append(node.name)
+            else:
+                channels.extend((node.name, channel) for channel in result)
+        return channels, unavailable
+
+    @staticmethod
+    def _sorted(sort, channels):
+        key = CHANNEL_SORTS[sort][1]
+        return sorted(channels, key=lambda entry: key(entry[1]))
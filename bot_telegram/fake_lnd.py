@@ -0,0 +1,448 @@
+import os
+import time
+import random
+import asyncio
+import logging
+import argparse
+import grpc
+import grpc.aio
+import lightning_pb2 as ln
+import router_pb2 as router
+from lightning_pb2_grpc import LightningServicer, add_LightningServicer_to_server
+from router_pb2_grpc import RouterServicer, add_RouterServicer_to_server
+
+# Same cap as the bot's channel options, so large synthetic histories still fit in one reply
+SERVER_OPTIONS = [
+    ('grpc.max_send_message_length', 50 * 1024 * 1024),
+    ('grpc.max_receive_message_length', 50 * 1024 * 1024),
+]
+
+DEFAULT_PAGE = 100  # What LND returns when a list request sets no page size
+TIP_HEIGHT = 850000
+BLOCK_INTERVAL = 600
+
+
+def _bytes(rng, n):
+    # Random.randbytes needs Python 3.9
+    return rng.getrandbits(8 * n).to_bytes(n, 'big')
+
+
+def _hex(rng, n):
+    return _bytes(rng, n).hex()
+
+
+class FakeNodeData:
+    """Synthetic node state: channels, invoices, payments, on-chain transactions and forwards.
+
+    Everything is generated from seed and now (the current time unless
+    given), so two runs with the same sizes, seed and now see byte-identical
+    data. Timestamps are spread over the `days` days before now; anything
+    added later happens one second after the previous addition.
+    """
+
+    def __init__(self, channels=10, invoices=100, payments=100, transactions=100, forwards=1000,
+                 days=365, seed=1, now=None):
+        rng = random.Random(seed)
+        self.rng = rng
+        self.now = int(time.time()) if now is None else now
+        now = self.now
+        self.alias = f"fake-{seed}"
+        self.pubkey = '02' + _hex(rng, 32)
+        self.block_height = TIP_HEIGHT
+        self.channels = [self._channel(i) for i in range(channels)]
+
+        self.invoices = []
+        self.settled = 0
+        for created in sorted(now - rng.randrange(days * 86400) for _ in range(invoices)):
+            self.add_invoice(created)
+
+        self.payments = []
+        for created in sorted(now - rng.randrange(days * 86400) for _ in range(payments)):
+            self.add_payment(created)
+
+        self.transactions = []
+        for created in sorted(now - rng.randrange(days * 86400) for _ in range(transactions)):
+            self.add_transaction(created)
+
+        self.forwards = []
+        for created in sorted(now - rng.randrange(days * 86400) for _ in range(forwards)):
+            self.add_forward(created * 10 ** 9 + rng.randrange(10 ** 9))
+
+    def tick(self):
+        # The node's clock only moves when something happens on it
+        self.now += 1
+        return self.now
+
+    def _channel(self, i):
+        rng = self.rng
+        capacity = rng.choice((1, 2, 5, 10, 20, 50)) * 1000000
+        local = rng.randrange(capacity)
+        lifetime = rng.randrange(86400, 365 * 86400)
+        return ln.Channel(
+            active=rng.random() > 0.1, remote_pubkey='03' + _hex(rng, 32),
+            channel_point=f"{_hex(rng, 32)}:{rng.randrange(4)}",
+            chan_id=(TIP_HEIGHT - rng.randrange(100000)) << 40 | rng.randrange(3000) << 16 | i % 65536,
+            capacity=capacity, local_balance=local, remote_balance=capacity - local - 3000,
+            commit_fee=3000, total_satoshis_sent=rng.randrange(10 ** 9), total_satoshis_received=rng.randrange(10 ** 9),
+            num_updates=rng.randrange(10 ** 6), lifetime=lifetime, uptime=int(lifetime * rng.uniform(0.5, 1.0)),
+            peer_alias=f"peer-{i}",
+        )
+
+    def add_invoice(self, created=None, settled=None):
+        rng = self.rng
+        created = created or self.tick()
+        value_msat = rng.randrange(1000, 10 ** 9)
+        settled = rng.random() < 0.7 if settled is None else settled
+        invoice = ln.Invoice(
+            memo=f"invoice {len(self.invoices) + 1}", r_hash=_bytes(rng, 32), r_preimage=_bytes(rng, 32),
+            value=value_msat // 1000, value_msat=value_msat, creation_date=created,
+            payment_request='lnbc' + _hex(rng, 120), expiry=86400, add_index=len(self.invoices) + 1,
+            state=ln.Invoice.SETTLED if settled else ln.Invoice.OPEN,
+        )
+        if settled:
+            self.settle_invoice(invoice, created + rng.randrange(600))
+        self.invoices.append(invoice)
+        return invoice
+
+    def settle_invoice(self, invoice, settle_date=None):
+        self.settled += 1
+        invoice.state = ln.Invoice.SETTLED
+        invoice.settle_date = settle_date or self.tick()
+        invoice.settle_index = self.settled
+        invoice.amt_paid_sat = invoice.value
+        invoice.amt_paid_msat = invoice.value_msat
+        return invoice
+
+    def add_payment(self, created=None, status=None):
+        rng = self.rng
+        created = created or self.tick()
+        value_msat = rng.randrange(1000, 10 ** 9)
+        fee_msat = value_msat * rng.randrange(1, 2000) // 10 ** 6
+        payment = ln.Payment(
+            payment_hash=_hex(rng, 32), value=value_msat // 1000, value_sat=value_msat // 1000, value_msat=value_msat,
+            payment_preimage=_hex(rng, 32), fee_sat=fee_msat // 1000, fee_msat=fee_msat,
+            creation_date=created, creation_time_ns=created * 10 ** 9, payment_index=len(self.payments) + 1,
+            status=status if status is not None else ln.Payment.SUCCEEDED if rng.random() < 0.9 else ln.Payment.FAILED,
+        )
+        self.payments.append(payment)
+        return payment
+
+    def add_transaction(self, created=None, confirmed=True):
+        rng = self.rng
+        created = created or self.tick()
+        height = self.block_height - (self.now - created) // BLOCK_INTERVAL if confirmed else 0
+        tx = ln.Transaction(
+            tx_hash=_hex(rng, 32), amount=rng.randrange(-10 ** 8, 10 ** 8), time_stamp=created,
+            num_confirmations=max(self.block_height - height + 1, 1) if confirmed else 0,
+            block_height=max(height, 1) if confirmed else 0, block_hash=_hex(rng, 32) if confirmed else '',
+            total_fees=rng.randrange(200, 20000), raw_tx_hex=_hex(rng, 250), label='',
+        )
+        self.transactions.append(tx)
+        return tx
+
+    def add_forward(self, timestamp_ns=None):
+        rng = self.rng
+        timestamp_ns = timestamp_ns or self.tick() * 10 ** 9
+        chan_in, chan_out = rng.sample(self.channels, 2) if len(self.channels) > 1 else self.channels * 2
+        amt_out_msat = rng.randrange(1000, 10 ** 9)
+        fee_msat = 1000 + amt_out_msat * rng.randrange(1, 2000) // 10 ** 6
+        event = ln.ForwardingEvent(
+            timestamp=timestamp_ns // 10 ** 9, timestamp_ns=timestamp_ns,
+            chan_id_in=chan_in.chan_id, chan_id_out=chan_out.chan_id,
+            amt_in=(amt_out_msat + fee_msat) // 1000, amt_out=amt_out_msat // 1000, fee=fee_msat // 1000,
+            amt_in_msat=amt_out_msat + fee_msat, amt_out_msat=amt_out_msat, fee_msat=fee_msat,
+            peer_alias_in=chan_in.peer_alias, peer_alias_out=chan_out.peer_alias,
+        )
+        self.forwards.append(event)
+        return event
+
+
+def _page(items, index_of, index_offset, count, reverse):
+    # LND's list paging: index_offset is exclusive, pages are always returned oldest first
+    count = count or DEFAULT_PAGE
+    if reverse:
+        older = [item for item in items if not index_offset or index_of(item) < index_offset]
+        return older[-count:]
+    return [item for item in items if index_of(item) > index_offset][:count]
+
+
+class _Streams:
+    """Fan-out of emitted stream messages to every open subscription of a kind."""
+
+    def __init__(self):
+        self._subscribers = {}  # kind -> set of queues
+
+    def emit(self, kind, message):
+        for queue in self._subscribers.get(kind, ()):
+            queue.put_nowait(message)
+
+    async def subscribe(self, kind):
+        queue = asyncio.Queue()
+        self._subscribers.setdefault(kind, set()).add(queue)
+        try:
+            while True:
+                yield await queue.get()
+        finally:
+            self._subscribers[kind].discard(queue)
+
+    def count(self, kind):
+        return len(self._subscribers.get(kind, ()))
+
+
+class FakeLightning(LightningServicer):
+    """Lightning service answering from FakeNodeData, with injected latency.
+
+    latency is seconds per unary call, either one number or a dict of method
+    name to seconds (missing methods get none); jitter adds up to that many
+    seconds at random.
+    """
+
+    def __init__(self, data, streams, latency=0.0, jitter=0.0):
+        self.data = data
+        self.streams = streams
+        self.latency = latency
+        self.jitter = jitter
+        self.calls = {}  # method -> count
+
+    async def _delay(self, method):
+        self.calls[method] = self.calls.get(method, 0) + 1
+        delay = self.latency.get(method, 0.0) if isinstance(self.latency, dict) else self.latency
+        if self.jitter:
+            delay += self.data.rng.uniform(0, self.jitter)
+        if delay:
+            await asyncio.sleep(delay)
+
+    async def GetInfo(self, request, context):
+        await self._delay('GetInfo')
+        data = self.data
+        active = sum(1 for channel in data.channels if channel.active)
+        return ln.GetInfoResponse(
+            version='0.18.0-beta commit=fake', identity_pubkey=data.pubkey, alias=data.alias,
+            num_active_channels=active, num_inactive_channels=len(data.channels) - active,
+            num_peers=len(data.channels), block_height=data.block_height, synced_to_chain=True, synced_to_graph=True,
+        )
+
+    async def WalletBalance(self, request, context):
+        await self._delay('WalletBalance')
+        total = sum(tx.amount for tx in self.data.transactions) % 10 ** 9
+        return ln.WalletBalanceResponse(total_balance=total, confirmed_balance=total)
+
+    async def ListChannels(self, request, context):
+        await self._delay('ListChannels')
+        channels = self.data.channels
+        if request.active_only:
+            channels = [channel for channel in channels if channel.active]
+        elif request.inactive_only:
+            channels = [channel for channel in channels if not channel.active]
+        return ln.ListChannelsResponse(channels=channels)
+
+    async def GetTransactions(self, request, context):
+        await self._delay('GetTransactions')
+        start, end = request.start_height, request.end_height
+        if start == 0 and end == 0:
+            end = -1  # No bounds means the whole history
+        txs = []
+        for tx in self.data.transactions:
+            if tx.block_height == 0:
+                if end == -1:
+                    txs.append(tx)
+            elif tx.block_height >= start and (end == -1 or tx.block_height <= end):
+                txs.append(tx)
+        return ln.TransactionDetails(transactions=txs)
+
+    async def ListInvoices(self, request, context):
+        await self._delay('ListInvoices')
+        invoices = self.data.invoices
+        if request.pending_only:
+            invoices = [invoice for invoice in invoices if invoice.state == ln.Invoice.OPEN]
+        page = _page(invoices, lambda invoice: invoice.add_index,
+                     request.index_offset, request.num_max_invoices, request.reversed)
+        return ln.ListInvoiceResponse(
+            invoices=page,
+            first_index_offset=page[0].add_index if page else 0,
+            last_index_offset=page[-1].add_index if page else request.index_offset,
+        )
+
+    async def LookupInvoice(self, request, context):
+        await self._delay('LookupInvoice')
+        for invoice in self.data.invoices:
+            if invoice.r_hash == request.r_hash:
+                return invoice
+        await context.abort(grpc.StatusCode.NOT_FOUND, "unable to locate invoice")
+
+    async def ListPayments(self, request, context):
+        await self._delay('ListPayments')
+        payments = self.data.payments
+        if not request.include_incomplete:
+            payments = [payment for payment in payments if payment.status == ln.Payment.SUCCEEDED]
+        page = _page(payments, lambda payment: payment.payment_index,
+                     request.index_offset, request.max_payments, request.reversed)
+        return ln.ListPaymentsResponse(
+            payments=page,
+            first_index_offset=page[0].payment_index if page else 0,
+            last_index_offset=page[-1].payment_index if page else request.index_offset,
+        )
+
+    async def ForwardingHistory(self, request, context):
+        await self._delay('ForwardingHistory')
+        now = self.data.now
+        start = request.start_time or now - 86400
+        end = request.end_time or now
+        events = [event for event in self.data.forwards if start <= event.timestamp <= end]
+        count = request.num_max_events or DEFAULT_PAGE
+        page = events[request.index_offset:request.index_offset + count]
+        return ln.ForwardingHistoryResponse(forwarding_events=page,
+                                            last_offset_index=request.index_offset + len(page))
+
+    async def SubscribeInvoices(self, request, context):
+        # Backlog past the given indexes first, like LND, then live invoices
+        for invoice in self.data.invoices:
+            if request.add_index and invoice.add_index > request.add_index:
+                yield invoice
+            elif request.settle_index and invoice.settle_index > request.settle_index:
+                yield invoice
+        async for invoice in self.streams.subscribe('invoices'):
+            yield invoice
+
+    async def SubscribeTransactions(self, request, context):
+        async for tx in self.streams.subscribe('transactions'):
+            yield tx
+
+    async def SubscribeChannelEvents(self, request, context):
+        async for update in self.streams.subscribe('channels'):
+            yield update
+
+
+class FakeRouter(RouterServicer):
+    """routerrpc streams of the fake node."""
+
+    def __init__(self, streams):
+        self.streams = streams
+
+    async def SubscribeHtlcEvents(self, request, context):
+        yield router.HtlcEvent(subscribed_event=router.SubscribedEvent())
+        async for event in self.streams.subscribe('htlcs'):
+            yield event
+
+    async def TrackPayments(self, request, context):
+        async for payment in self.streams.subscribe('payments'):
+            yield payment
+
+
+class FakeLnd:
+    """In-process stand-in for an LND node, served over gRPC local credentials.
+
+    Connect to it by configuring a node without a cert at `address` (any
+    macaroon is accepted). emit_* add data to the node and push it to every
+    open subscription, and generate_events() does so continuously at a rate.
+    """
+
+    def __init__(self, data=None, latency=0.0, jitter=0.0):
+        self.data = data or FakeNodeData()
+        self.streams = _Streams()
+        self.lightning = FakeLightning(self.data, self.streams, latency, jitter)
+        self.router = FakeRouter(self.streams)
+        self.address = None
+        self._server = None
+
+    async def start(self, address='localhost:0'):
+        self._server = grpc.aio.server(options=SERVER_OPTIONS)
+        add_LightningServicer_to_server(self.lightning, self._server)
+        add_RouterServicer_to_server(self.router, self._server)
+        port = self._server.add_secure_port(address, grpc.local_server_credentials(grpc.LocalConnectionType.LOCAL_TCP))
+        await self._server.start()
+        self.address = f"{address.rsplit(':', 1)[0]}:{port}"
+        return self.address
+
+    async def stop(self, grace=None):
+        if self._server is not None:
+            await self._server.stop(grace)
+            self._server = None
+
+    def emit_invoice(self, settled=True):
+        invoice = self.data.add_invoice(settled=settled)
+        self.streams.emit('invoices', invoice)
+        return invoice
+
+    def emit_payment(self):
+        payment = self.data.add_payment()
+        self.streams.emit('payments', payment)
+        return payment
+
+    def emit_transaction(self, confirmed=False):
+        tx = self.data.add_transaction(confirmed=confirmed)
+        self.streams.emit('transactions', tx)
+        return tx
+
+    def emit_channel_event(self, active=None):
+        # Flip a random channel's activity, or set it to active
+        channel = self.data.rng.choice(self.data.channels)
+        channel.active = (not channel.active) if active is None else active
+        txid, index = channel.channel_point.split(':')
+        point = ln.ChannelPoint(funding_txid_str=txid, output_index=int(index))
+        if channel.active:
+            update = ln.ChannelEventUpdate(type=ln.ChannelEventUpdate.ACTIVE_CHANNEL, active_channel=point)
+        else:
+            update = ln.ChannelEventUpdate(type=ln.ChannelEventUpdate.INACTIVE_CHANNEL, inactive_channel=point)
+        self.streams.emit('channels', update)
+        return update
+
+    def emit_forward(self):
+        # The forwarding log gets the event, HTLC subscribers see the forward and its settle
+        event = self.data.add_forward()
+        htlc_id = len(self.data.forwards)
+        common = dict(incoming_channel_id=event.chan_id_in, outgoing_channel_id=event.chan_id_out,
+                      incoming_htlc_id=htlc_id, outgoing_htlc_id=htlc_id, event_type=router.HtlcEvent.FORWARD)
+        info = router.HtlcInfo(incoming_amt_msat=event.amt_in_msat, outgoing_amt_msat=event.amt_out_msat)
+        self.streams.emit('htlcs', router.HtlcEvent(timestamp_ns=event.timestamp_ns,
+                                                    forward_event=router.ForwardEvent(info=info), **common))
+        self.streams.emit('htlcs', router.HtlcEvent(timestamp_ns=event.timestamp_ns,
+                                                    settle_event=router.SettleEvent(), **common))
+        return event
+
+    async def generate_events(self, rate=1.0):
+        # Random stream events, on average `rate` per second, until cancelled
+        emitters = [self.emit_invoice, self.emit_payment, self.emit_transaction,
+                    self.emit_channel_event, self.emit_forward]
+        while True:
+            await asyncio.sleep(self.data.rng.expovariate(rate))
+            self.data.rng.choice(emitters)()
+
+
+async def _serve(args):
+    data = FakeNodeData(channels=args.channels, invoices=args.invoices, payments=args.payments,
+                        transactions=args.transactions, forwards=args.forwards, seed=args.seed, now=args.now)
+    lnd = FakeLnd(data, latency=args.latency, jitter=args.jitter)
+    address = await lnd.start(f"localhost:{args.port}")
+    logging.info(f"Fake LND '{data.alias}' listening on {address}; configure it with "
+                 f"LND_NODES='[{{\"name\": \"fake\", \"host\": \"{address}\", \"cert\": null, "
+                 f"\"macaroon\": \"{os.devnull}\"}}]'")
+    try:
+        if args.event_rate:
+            await lnd.generate_events(args.event_rate)
+        else:
+            await asyncio.Event().wait()
+    finally:
+        await lnd.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a synthetic LND node for offline runs of the bot.")
+    parser.add_argument('--port', type=int, default=10019)
+    parser.add_argument('--channels', type=int, default=10)
+    parser.add_argument('--invoices', type=int, default=100)
+    parser.add_argument('--payments', type=int, default=100)
+    parser.add_argument('--transactions', type=int, default=100)
+    parser.add_argument('--forwards', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--now', type=int, help="Unix time the node's history ends at (default: the current time)")
+    parser.add_argument('--latency', type=float, default=0.0, help="Seconds added to every unary call")
+    parser.add_argument('--jitter', type=float, default=0.0, help="Up to this many extra seconds at random")
+    parser.add_argument('--event-rate', type=float, default=0.0, help="Random stream events per second")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+    asyncio.run(_serve(args))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,90 @@
+from lightning_pb2 import ForwardingHistoryRequest
+from router_pb2 import SubscribeHtlcEventsRequest, HtlcEvent
+from monitor import StreamMonitor
+
+FORWARDS_PAGE_SIZE = 10000  # LND caps a page at 50000 events
+RECENT_FORWARDS = 25  # Forwards per reply of the forwarding view, older ones are a button away
+
+# LND only returns the last 24 hours when start_time is unset, and index_offset
+# counts from start_time, so a fixed start at the epoch keeps offsets absolute.
+FORWARDS_START_TIME = 1
+
+
+async def sync_forwards(stub, store, page_size=FORWARDS_PAGE_SIZE):
+    # Fetch only the events after the last stored offset, page by page
+    offset = store.get_cursor('forwards')
+    fetched = 0
+    while True:
+        response = await stub.ForwardingHistory(ForwardingHistoryRequest(
+            start_time=FORWARDS_START_TIME, index_offset=offset,
+            num_max_events=page_size, peer_alias_lookup=True,
+        ))
+        events = response.forwarding_events
+        if not events:
+            break
+        store.add_forwards(events, offset + 1, response.last_offset_index)
+        offset = response.last_offset_index
+        fetched += len(events)
+        if len(events) < page_size:
+            break
+    return fetched
+
+
+class HtlcMonitor(StreamMonitor):
+    """Records forwards as they happen from routerrpc SubscribeHtlcEvents.
+
+    A forward is matched from its ForwardEvent (amounts) to the final settle or
+    failure by its incoming/outgoing circuit. Settled forwards go to the store's
+    live table until the forwarding log catches up with them; the log itself is
+    only read once per subscription, to fill the gap while the bot was offline.
+    """
+
+    name = 'HTLC'
+
+    def __init__(self, get_stub, get_ln_stub, store, notify=None):
+        super().__init__(get_stub)
+        self.get_ln_stub = get_ln_stub
+        self.store = store
+        self.notify = notify
+        self._in_flight = {}  # circuit -> HtlcInfo of the forward
+
+    async def subscribe(self, stub):
+        # Circuits that resolved while the stream was down never get their settle or fail
+        # event; the forwarding log sync below records the settled ones instead
+        self._in_flight.clear()
+        stream = stub.SubscribeHtlcEvents(SubscribeHtlcEventsRequest())
+        await sync_forwards(self.get_ln_stub(), self.store)
+        self.store.prune_live_forwards()
+        return stream
+
+    async def handle(self, event):
+        if event.event_type != HtlcEvent.FORWARD:
+            return
+        circuit = (event.incoming_channel_id, event.incoming_htlc_id,
+                   event.outgoing_channel_id, event.outgoing_htlc_id)
+        kind = event.WhichOneof('event')
+        if kind == 'forward_event':
+            self._in_flight[circuit] = event.forward_event.info
+        elif kind == 'settle_event':
+            info = self._in_flight.pop(circuit, None)
+            if info is None:
+                # Forwarded before we subscribed, the forwarding log will pick it up
+                return
+            self.store.add_live_forward(event.timestamp_ns, event.incoming_channel_id, event.outgoing_channel_id,
+                                        info.incoming_amt_msat, info.outgoing_amt_msat)
+            if self.notify is not None:
+                await self.notify(
+                    f"⚡ Forwarded {info.incoming_amt_msat // 1000} satoshis to {event.outgoing_channel_id}.\n"
+                    f"   Fee: {(info.incoming_amt_msat - info.outgoing_amt_msat) // 1000} satoshis"
+                )
+        elif kind == 'forward_fail_event':
+            info = self._in_flight.pop(circuit, None)
+            if info is not None:
+                self._record_failure(event, info, 'failed downstream')
+        elif kind == 'link_fail_event':
+            link_fail = event.link_fail_event
+            self._record_failure(event, link_fail.info, link_fail.failure_string or 'link failure')
+
+    def _record_failure(self, event, info, reason):
+        self.store.add_forward_failure(event.timestamp_ns, event.incoming_channel_id, event.outgoing_channel_id,
+                                       info.incoming_amt_msat, info.outgoing_amt_msat, reason)
@@ -0,0 +1,111 @@
+import time
+import random
+import asyncio
+import logging
+import grpc
+import grpc.aio
+from metrics import metrics_interceptors, method_name, RPC_RETRIES
+
+DEFAULT_DEADLINE = 10.0  # Seconds, for unary RPCs without an explicit timeout
+# Calls that may walk a large part of the node's history get longer
+METHOD_DEADLINES = {
+    'GetTransactions': 30.0,
+    'ListInvoices': 30.0,
+    'ListPayments': 30.0,
+    'ForwardingHistory': 30.0,
+    'ListChannels': 20.0,
+    'ClosedChannels': 20.0,
+}
+
+# Read-only RPCs, safe to send again when LND was unreachable
+IDEMPOTENT_METHODS = frozenset({
+    'GetInfo', 'WalletBalance', 'ChannelBalance', 'ListChannels', 'PendingChannels', 'ClosedChannels',
+    'GetTransactions', 'ListInvoices', 'LookupInvoice', 'ListPayments', 'ForwardingHistory',
+    'GetNodeInfo', 'GetChanInfo', 'ListPeers', 'FeeReport', 'DescribeGraph', 'GetNetworkInfo',
+})
+MAX_ATTEMPTS = 3
+RETRY_BASE_DELAY = 0.2
+RETRY_MAX_DELAY = 2.0
+
+SLOW_CALL_THRESHOLD = 2.0  # Seconds above which a unary RPC is logged
+
+
+class DeadlineInterceptor(grpc.aio.UnaryUnaryClientInterceptor):
+    """Gives unary RPCs issued without a timeout their method's default deadline."""
+
+    def __init__(self, deadlines=METHOD_DEADLINES, default=DEFAULT_DEADLINE):
+        self.deadlines = deadlines
+        self.default = default
+
+    async def intercept_unary_unary(self, continuation, client_call_details, request):
+        if client_call_details.timeout is None:
+            timeout = self.deadlines.get(method_name(client_call_details), self.default)
+            client_call_details = client_call_details._replace(timeout=timeout)
+        return await continuation(client_call_details, request)
+
+
+class RetryInterceptor(grpc.aio.UnaryUnaryClientInterceptor):
+    """Retries idempotent unary RPCs that failed with UNAVAILABLE.
+
+    Waits use full jitter over an exponential backoff, so callers that failed
+    together don't retry together. Every attempt only gets what is left of the
+    call's original deadline.
+    """
+
+    def __init__(self, node, methods=IDEMPOTENT_METHODS, attempts=MAX_ATTEMPTS,
+                 base_delay=RETRY_BASE_DELAY, max_delay=RETRY_MAX_DELAY):
+        self.node = node
+        self.methods = methods
+        self.attempts = attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    async def intercept_unary_unary(self, continuation, client_call_details, request):
+        method = method_name(client_call_details)
+        if method not in self.methods:
+            return await continuation(client_call_details, request)
+        timeout = client_call_details.timeout
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        for attempt in range(1, self.attempts + 1):
+            try:
+                return await (await continuation(client_call_details, request))
+            except grpc.aio.AioRpcError as e:
+                if e.code() != grpc.StatusCode.UNAVAILABLE or attempt == self.attempts:
+                    raise
+                delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+                if deadline is not None:
+                    remaining = deadline - time.monotonic() - delay
+                    if remaining <= 0:
+                        raise
+                    client_call_details = client_call_details._replace(timeout=remaining)
+                RPC_RETRIES.inc((self.node, method))
+                logging.warning(f"{method} on {self.node} unavailable, retrying in {delay:.2f}s "
+                                f"(attempt {attempt + 1}/{self.attempts})")
+                await asyncio.sleep(delay)
+
+
+class SlowCallInterceptor(grpc.aio.UnaryUnaryClientInterceptor):
+    """Logs unary RPCs, retries included, that take longer than the threshold."""
+
+    def __init__(self, node, threshold=SLOW_CALL_THRESHOLD):
+        self.node = node
+        self.threshold = threshold
+
+    async def intercept_unary_unary(self, continuation, client_call_details, request):
+        start = time.perf_counter()
+        try:
+            return await (await continuation(client_call_details, request))
+        finally:
+            elapsed = time.perf_counter() - start
+            if elapsed > self.threshold:
+                logging.warning(f"Slow LND call {method_name(client_call_details)} on {self.node}: {elapsed:.2f}s")
+
+
+def client_interceptors(node, slow_call_threshold=SLOW_CALL_THRESHOLD):
+    # Outermost first: metrics (timing and response bytes) see each call once however
+    # often it is retried, and retries stay within the deadline set just outside them
+    return metrics_interceptors(node) + [
+        SlowCallInterceptor(node, slow_call_threshold),
+        DeadlineInterceptor(),
+        RetryInterceptor(node),
+    ]
@@ -0,0 +1,102 @@
+from lightning_pb2 import ListInvoiceRequest, InvoiceSubscription, Invoice
+from monitor import StreamMonitor
+
+RECENT_INVOICES = 10
+INVOICES_PAGE_SIZE = 1000
+
+
+async def sync_invoices(stub, store, page_size=INVOICES_PAGE_SIZE):
+    # Page forwards through the invoices added since the stored add_index. Returns the ones
+    # settled past the stored settle_index; on a fresh store the history isn't news, so
+    # the settle_index is seeded from it instead.
+    offset = store.get_cursor('invoice_add_index')
+    settle_index = store.get_cursor('invoice_settle_index')
+    fresh = offset == 0
+    settled = []
+    while True:
+        response = await stub.ListInvoices(ListInvoiceRequest(
+            pending_only=False, index_offset=offset, num_max_invoices=page_size,
+        ))
+        invoices = response.invoices
+        if not invoices:
+            break
+        store.add_invoices(invoices)
+        if fresh:
+            settle_index = max(settle_index, max(invoice.settle_index for invoice in invoices))
+        else:
+            settled += [invoice for invoice in invoices if invoice.settle_index > settle_index]
+        offset = response.last_index_offset
+        store.set_cursor('invoice_add_index', offset)
+        if len(invoices) < page_size:
+            break
+    if fresh:
+        store.set_cursor('invoice_settle_index', settle_index)
+    return settled
+
+
+class InvoiceMonitor(StreamMonitor):
+    """Records invoices in the store from SubscribeInvoices and pushes settlements to the chat.
+
+    The last add_index/settle_index are kept in the store so a restart resumes
+    the subscription where it stopped, without replaying or missing invoices.
+    Invoices added while the bot was offline are caught up from ListInvoices,
+    and invoices stored while still open are read again, as LND has no
+    settle backlog to replay while the stored settle_index is 0.
+    """
+
+    name = 'invoice'
+
+    def __init__(self, get_stub, store, notify=None):
+        super().__init__(get_stub)
+        self.store = store
+        self.notify = notify
+
+    async def subscribe(self, stub):
+        stream = stub.SubscribeInvoices(InvoiceSubscription(
+            add_index=self.store.get_cursor('invoice_add_index'),
+            settle_index=self.store.get_cursor('invoice_settle_index'),
+        ))
+        settled = await self._reread_open(stub)
+        settled += await sync_invoices(stub, self.store)
+        # In settlement order, so the settle_index only moves forward; the stream's own
+        # backlog replays these again, but by then they are behind the settle_index
+        for invoice in sorted(settled, key=lambda invoice: invoice.settle_index):
+            await self._settled(invoice)
+        return stream
+
+    async def handle(self, invoice):
+        self.store.add_invoices([invoice])
+        await self._settled(invoice)
+        if invoice.add_index > self.store.get_cursor('invoice_add_index'):
+            self.store.set_cursor('invoice_add_index', invoice.add_index)
+
+    async def _reread_open(self, stub, page_size=INVOICES_PAGE_SIZE):
+        # Invoices that settled while the bot was offline, out of the ones stored as still open.
+        # They are paged through with ListInvoices from the oldest one rather than looked up one by one.
+        open_indexes = set(self.store.invoice_indexes((Invoice.OPEN, Invoice.ACCEPTED)))
+        settled = []
+        offset = min(open_indexes, default=1) - 1
+        last = max(open_indexes, default=0)
+        while offset < last:
+            response = await stub.ListInvoices(ListInvoiceRequest(
+                pending_only=False, index_offset=offset, num_max_invoices=page_size,
+            ))
+            invoices = [invoice for invoice in response.invoices if invoice.add_index in open_indexes
+                        and invoice.state not in (Invoice.OPEN, Invoice.ACCEPTED)]
+            if invoices:
+                self.store.add_invoices(invoices)
+            settled += invoices
+            if len(response.invoices) < page_size:
+                break
+            offset = response.last_index_offset
+        return settled
+
+    async def _settled(self, invoice):
+        if invoice.settle_index > self.store.get_cursor('invoice_settle_index'):
+            if self.notify is not None:
+                await self.notify(
+                    f"⚡ You have received {invoice.amt_paid_sat} satoshis via a Lightning invoice.\n"
+                    f"   Memo: {invoice.memo}"
+                )
+            # Only advance once the notification went out, so a failure is retried on resubscribe
+            self.store.set_cursor('invoice_settle_index', invoice.settle_index)
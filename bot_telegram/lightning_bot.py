@@ -1,20 +1,25 @@
 import os
-import psutil
-import grpc
 import time
 import asyncio
 import logging
-import requests
-from threading import Thread
+import sqlite3
+import itertools
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup, Update
 from telegram.ext import Application, CommandHandler, CallbackQueryHandler
-from lightning_pb2 import (
-    GetInfoRequest, WalletBalanceRequest, ListChannelsRequest,
-    ListInvoiceRequest, GetTransactionsRequest, InvoiceSubscription,
-    ListPaymentsRequest, ForwardingHistoryRequest
-)
-from lightning_pb2_grpc import LightningStub
-from datetime import datetime
+from telegram.error import BadRequest
+from lightning_pb2 import GetInfoRequest, WalletBalanceRequest, Payment
+from nodes import load_nodes, gather_nodes, node_error
+from invoices import RECENT_INVOICES
+from payments import RECENT_PAYMENTS
+from forwards import RECENT_FORWARDS
+from onchain import RECENT_ONCHAIN
+from channels import ChannelBrowser, CHANNEL_SORTS
+from market import MarketData
+from output import chunk_records, send_chunks
+from throttle import SingleFlight, RateLimiter
+from view_cache import ViewCache
+from metrics import REGISTRY, MetricsServer, observe_handler
+from datetime import datetime, timezone
 
 # Configure the Telegram API token and chat ID
 TELEGRAM_TOKEN = os.getenv('TELEGRAM_TOKEN')
@@ -24,23 +29,74 @@ CHAT_ID = os.getenv('CHAT_ID')
 LND_DIR = os.getenv('LND_DIR', '/path/to/your/lnd/')  # Update with actual path if needed
 CERT_PATH = os.path.join(LND_DIR, 'tls.cert')
 MACAROON_PATH = os.path.join(LND_DIR, 'chain/bitcoin/mainnet/admin.macaroon')
+LND_GRPC_HOST = os.getenv('LND_GRPC_HOST', 'localhost:10009')
+
+# Several nodes can be configured instead, as a JSON list of
+# {"name": ..., "host": ..., "cert": ..., "macaroon": ...} objects
+LND_NODES = os.getenv('LND_NODES')
+LND_NODE_NAME = os.getenv('LND_NODE_NAME', 'lnd')
+
+# Seconds each node gets to answer before a view is shown without it
+NODE_TIMEOUT = float(os.getenv('NODE_TIMEOUT', '10'))
+
+# Local address the Prometheus /metrics endpoint listens on, empty to disable it
+METRICS_ADDR = os.getenv('METRICS_ADDR', '127.0.0.1:9464')
+
+# Local event store
+DATA_DIR = os.getenv('DATA_DIR', os.path.dirname(os.path.abspath(__file__)))
+STORE_PATH = os.path.join(DATA_DIR, 'lightning_bot.db')
+
+# Seconds Bitcoin price and fee data is cached before a background refresh
+MARKET_DATA_TTL = int(os.getenv('MARKET_DATA_TTL', '60'))
+
+# Chat notification for every settled forward, off by default as a busy routing node would flood the chat
+NOTIFY_FORWARDS = os.getenv('NOTIFY_FORWARDS', '').lower() in ('1', 'true', 'yes')
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
-def get_macaroon_hex():
-    with open(MACAROON_PATH, 'rb') as f:
-        macaroon_bytes = f.read()
-    return macaroon_bytes.hex()
+# One macaroon, pooled grpc.aio channel, event store and set of stream monitors
+# per LND node; the monitors keep each store current so history views never go back to LND
+nodes = load_nodes(LND_NODES, (LND_NODE_NAME, LND_GRPC_HOST, CERT_PATH, MACAROON_PATH), STORE_PATH)
+
+# Cached CoinGecko / mempool.space data
+market_data = MarketData(ttl=MARKET_DATA_TTL)
+
+# Channels of all nodes, paged from their in-memory mirrors
+channel_browser = ChannelBrowser(nodes, timeout=NODE_TIMEOUT)
+
+# Identical concurrent requests share one LND round trip, and chats tapping
+# faster than their token bucket allows get the last fetched data instead
+flights = SingleFlight()
+rate_limiter = RateLimiter()
 
-def get_ln_stub():
-    with open(CERT_PATH, 'rb') as f:
-        cert = f.read()
-    creds = grpc.ssl_channel_credentials(cert)
-    auth_creds = grpc.metadata_call_credentials(lambda context, callback: callback([('macaroon', get_macaroon_hex())], None))
-    combined_creds = grpc.composite_channel_credentials(creds, auth_creds)
-    channel = grpc.secure_channel('localhost:10009', combined_creds)
-    return LightningStub(channel)
+# Rendered views, reused while the data behind them is unchanged
+view_cache = ViewCache()
+
+# Counters kept by the components themselves, read when /metrics is scraped
+REGISTRY.gauge('lnd_channel_handshakes', "Times each node's channel became READY.", ('node',),
+               lambda: [((node.name,), node.channel.handshakes) for node in nodes], kind='counter')
+REGISTRY.gauge('lnd_channel_rebuilds', "Times each node's channel was created.", ('node',),
+               lambda: [((node.name,), node.channel.rebuilds) for node in nodes], kind='counter')
+REGISTRY.gauge('lnd_monitor_events', "Messages handled by each stream monitor.", ('node', 'monitor'),
+               lambda: [((node.name, monitor.name), monitor.events) for node in nodes for monitor in node.monitors],
+               kind='counter')
+REGISTRY.gauge('view_cache_hits', "Views served from the rendered view cache.", ('view',),
+               lambda: [((view,), count) for view, count in view_cache.hits.items()], kind='counter')
+REGISTRY.gauge('view_cache_misses', "Views that had to be rendered.", ('view',),
+               lambda: [((view,), count) for view, count in view_cache.misses.items()], kind='counter')
+REGISTRY.gauge('requests_coalesced', "Requests that joined an in-flight identical request.", (),
+               lambda: [((), flights.coalesced)], kind='counter')
+REGISTRY.gauge('requests_reused', "Throttled requests served the last result.", (),
+               lambda: [((), flights.reused)], kind='counter')
+REGISTRY.gauge('taps_throttled', "Button taps over a chat's rate limit.", (),
+               lambda: [((), rate_limiter.throttled)], kind='counter')
+
+metrics_server = None
+
+def node_label(node_name):
+    # Records are only tagged with their node when there is more than one
+    return f"[{node_name}] " if len(nodes) > 1 else ""
 
 def get_cpu_temperature():
     try:
@@ -55,42 +111,11 @@ def get_cpu_temperature():
         logging.error(f"Error reading CPU temperature: {e}")
         return "Error reading temperature"
 
-def get_bitcoin_price_and_fees():
-    try:
-        # Get Bitcoin price in USD and EUR
-        coingecko_url = 'https://api.coingecko.com/api/v3/simple/price'
-        params = {
-            'ids': 'bitcoin',
-            'vs_currencies': 'usd,eur',
-            'include_market_cap': 'false',
-            'include_24hr_vol': 'false',
-            'include_24hr_change': 'false',
-            'include_last_updated_at': 'true'
-        }
-        response = requests.get(coingecko_url, params=params)
-        price_data = response.json()
-        
-        # Get network fees from Mempool
-        mempool_url = 'https://mempool.space/api/v1/fees/recommended'
-        response = requests.get(mempool_url)
-        fees_data = response.json()
-        
-        btc_price_usd = price_data['bitcoin']['usd']
-        btc_price_eur = price_data['bitcoin']['eur']
-        fast_fee = fees_data['fastestFee']
-        half_hour_fee = fees_data['halfHourFee']
-        hour_fee = fees_data['hourFee']
-        
-        return (btc_price_usd, btc_price_eur, fast_fee, half_hour_fee, hour_fee)
-    except Exception as e:
-        logging.error(f"Error fetching Bitcoin price and fees: {e}")
-        return (None, None, None, None, None)
-
 async def start(update: Update, context):
-    await show_menu(update)
+    await observe_handler('start', show_menu(update))
 
 async def menu(update: Update, context):
-    await show_menu(update)
+    await observe_handler('menu', show_menu(update))
 
 async def show_menu(update: Update):
     keyboard = [
@@ -98,6 +123,7 @@ async def show_menu(update: Update):
         [InlineKeyboardButton("📊 Channel Info", callback_data='channelinfo')],
         [InlineKeyboardButton("🔄 Recent Transactions", callback_data='recenttransactions')],
         [InlineKeyboardButton("🔄 Forwarding Transactions", callback_data='forwardingtransactions')],
+        [InlineKeyboardButton("📈 Routing Stats", callback_data='routingstats:30')],
         [InlineKeyboardButton("₿ Bitcoin Info", callback_data='bitcoininfo')],
     ]
     reply_markup = InlineKeyboardMarkup(keyboard)
@@ -105,148 +131,407 @@ async def show_menu(update: Update):
 
 async def button(update: Update, context):
     query = update.callback_query
+    # Timed from the tap to the last reply, per view (the callback data up to its arguments)
+    await observe_handler(query.data.split(':', 1)[0], dispatch(query))
+
+async def dispatch(query):
     await query.answer()
+    throttled = not rate_limiter.allow(query.message.chat_id)
 
     if query.data == 'nodeinfo':
-        await get_node_info(query)
+        await get_node_info(query, throttled)
     elif query.data == 'channelinfo':
         await get_channel_info(query)
+    elif query.data.startswith('channels:'):
+        _, sort, page = query.data.split(':')
+        await get_channel_info(query, sort, int(page), edit=True)
     elif query.data == 'recenttransactions':
         await get_recent_transactions(query)
     elif query.data == 'forwardingtransactions':
         await get_forwarding_transactions(query)
+    elif query.data.startswith('routingstats:'):
+        await get_routing_stats(query, int(query.data.split(':', 1)[1]))
     elif query.data == 'bitcoininfo':
         await get_bitcoin_info(query)
+    elif query.data.startswith('olderinvoices:'):
+        _, node_index, index_offset = query.data.split(':')
+        await get_older_invoices(query, int(node_index), int(index_offset))
+    elif query.data.startswith('olderforwards:'):
+        _, since, before_ns = query.data.split(':')
+        await get_forwarding_transactions(query, int(since), int(before_ns))
 
-async def get_node_info(update):
+async def timed(name, awaitable):
+    start = time.perf_counter()
     try:
-        stub = get_ln_stub()
-        
-        # Get node info
-        info_response = stub.GetInfo(GetInfoRequest())
-        
-        # Get wallet balance (on-chain)
-        balance_response = stub.WalletBalance(WalletBalanceRequest())
-        
-        # Get channel balance (Lightning)
-        channel_response = stub.ListChannels(ListChannelsRequest())
-        lightning_balance = sum(channel.local_balance for channel in channel_response.channels)
-        
-        # Get system info
-        cpu_usage = psutil.cpu_percent()
-        memory_info = psutil.virtual_memory()
-        disk_info = psutil.disk_usage('/')  # Generic path
-        cpu_temperature = get_cpu_temperature()
-        
-        # Prepare the response message
-        text = (f"⚡ Alias: {info_response.alias}\n"
-                f"🛠️ Version: {info_response.version}\n"
-                f"🔢 Block Height: {info_response.block_height}\n"
-                f"💰 On-chain Balance: {balance_response.total_balance} satoshis\n"
-                f"⚡ Lightning Balance: {lightning_balance} satoshis\n"
-                f"🔗 Total Channels: {len(channel_response.channels)}\n"
-                f"🖥️ CPU Usage: {cpu_usage}%\n"
-                f"🧠 Free Memory: {memory_info.available / (1024 ** 2):.2f} MB\n"
-                f"💾 Free Disk Space: {disk_info.free / (1024 ** 3):.2f} GB\n"
-                f"🌡️ CPU Temperature: {cpu_temperature}")
-                
-        await update.message.reply_text(text)
-    except grpc.RpcError as e:
-        logging.error(f"gRPC error while getting node info: {e.details()}")
-        await update.message.reply_text(f"Error retrieving node info: {e.details()}")
-
-async def get_channel_info(update):
+        return await awaitable
+    finally:
+        logging.debug(f"{name} took {(time.perf_counter() - start) * 1000:.1f} ms")
+
+def get_system_usage():
+    # Only Node Info needs psutil, it is loaded on the first tap rather than at startup
+    import psutil
+    return psutil.cpu_percent(), psutil.virtual_memory(), psutil.disk_usage('/')  # Generic path
+
+async def fetch_node_data(node):
+    stub = node.get_stub()
+
+    # Node info, on-chain balance and channels are independent, run them concurrently
+    return await asyncio.gather(
+        timed(f"{node.name} GetInfo", stub.GetInfo(GetInfoRequest())),
+        timed(f"{node.name} WalletBalance", stub.WalletBalance(WalletBalanceRequest())),
+        timed(f"{node.name} channels", node.channel_mirror.get_channels(stub)),
+    )
+
+async def fetch_all_node_data():
+    loop = asyncio.get_running_loop()
+    start = time.perf_counter()
+
+    # All nodes and the system probes at once, each node bounded by its own timeout
+    results = await asyncio.gather(
+        gather_nodes(nodes, fetch_node_data, NODE_TIMEOUT),
+        timed("system usage", loop.run_in_executor(None, get_system_usage)),
+        timed("CPU temperature", loop.run_in_executor(None, get_cpu_temperature)),
+    )
+    logging.debug(f"Node info gathered in {(time.perf_counter() - start) * 1000:.1f} ms")
+    return results
+
+def render_node_info(node_results, system_usage, cpu_temperature):
+    cpu_usage, memory_info, disk_info = system_usage
+
+    sections = []
+    totals = [0, 0, 0]
+    for node, result in zip(nodes, node_results):
+        if isinstance(result, Exception):
+            sections.append(f"⚠️ {node_label(node.name)}Node unavailable: {node_error(result)}")
+            continue
+        info_response, balance_response, channels = result
+
+        # Lightning balance
+        lightning_balance = sum(channel.local_balance for channel in channels)
+        totals[0] += balance_response.total_balance
+        totals[1] += lightning_balance
+        totals[2] += len(channels)
+
+        sections.append(f"{node_label(node.name)}⚡ Alias: {info_response.alias}\n"
+                        f"🛠️ Version: {info_response.version}\n"
+                        f"🔢 Block Height: {info_response.block_height}\n"
+                        f"💰 On-chain Balance: {balance_response.total_balance} satoshis\n"
+                        f"⚡ Lightning Balance: {lightning_balance} satoshis\n"
+                        f"🔗 Total Channels: {len(channels)}")
+    if len(nodes) > 1:
+        sections.append(f"Σ All nodes:\n"
+                        f"💰 On-chain Balance: {totals[0]} satoshis\n"
+                        f"⚡ Lightning Balance: {totals[1]} satoshis\n"
+                        f"🔗 Total Channels: {totals[2]}")
+
+    # Prepare the response message
+    return ("\n\n".join(sections) + "\n"
+            f"🖥️ CPU Usage: {cpu_usage}%\n"
+            f"🧠 Free Memory: {memory_info.available / (1024 ** 2):.2f} MB\n"
+            f"💾 Free Disk Space: {disk_info.free / (1024 ** 3):.2f} GB\n"
+            f"🌡️ CPU Temperature: {cpu_temperature}")
+
+async def get_node_info(update, throttled=False):
     try:
-        stub = get_ln_stub()
-        response = stub.ListChannels(ListChannelsRequest())
-        channels_info = "\n".join([
-            f"📡 Channel with {channel.remote_pubkey}\n"
-            f"   - Capacity: {channel.capacity} satoshis\n"
-            f"   - Local Balance: {channel.local_balance} satoshis\n"
-            f"   - Remote Balance: {channel.remote_balance} satoshis"
-            for channel in response.channels
-        ])
-        await update.message.reply_text(f"📊 Channels:\n{channels_info}")
-    except grpc.RpcError as e:
-        logging.error(f"gRPC error while getting channel info: {e.details()}")
-        await update.message.reply_text(f"Error retrieving channel info: {e.details()}")
+        node_data = await flights.do('nodeinfo', fetch_all_node_data, use_last=throttled)
+        text = view_cache.get('nodeinfo', node_data, lambda: render_node_info(*node_data))
+    except Exception as e:
+        # Unavailable nodes are shown in the view, this is the system probes (e.g. psutil missing)
+        details = e.details() if hasattr(e, 'details') else e
+        logging.error(f"Error retrieving node info: {details}")
+        await update.message.reply_text(f"Error retrieving node info: {details}")
+        return
+    await update.message.reply_text(text)
+
+async def get_channel_info(update, sort='capacity', page=0, edit=False):
+    channels, page, pages, total, unavailable, version = await channel_browser.page(sort, page)
+    text = view_cache.get(f'channels:{sort}:{page}', version,
+                          lambda: render_channel_page(channels, sort, page, pages, total, unavailable))
+    reply_markup = channel_browser_markup(sort, page, pages)
+
+    # Page turns and re-sorts replace the message they were pressed on
+    if edit:
+        try:
+            await update.edit_message_text(text, reply_markup=reply_markup)
+        except BadRequest as e:
+            # Pressing the sort that is already shown leaves the message unchanged
+            if 'not modified' not in str(e):
+                raise
+    else:
+        await update.message.reply_text(text, reply_markup=reply_markup)
+
+def render_channel_page(channels, sort, page, pages, total, unavailable):
+    channels_info = "\n".join([
+        f"📡 {node_label(node_name)}Channel with {channel.remote_pubkey}\n"
+        f"   - Capacity: {channel.capacity} satoshis\n"
+        f"   - Local Balance: {channel.local_balance} satoshis\n"
+        f"   - Remote Balance: {channel.remote_balance} satoshis\n"
+        f"   - Status: {'active' if channel.active else 'inactive'}"
+        for node_name, channel in channels
+    ])
+    text = f"📊 Channels ({total}, by {CHANNEL_SORTS[sort][0].lower()}, page {page + 1}/{pages}):\n{channels_info}"
+    if unavailable:
+        text += f"\n⚠️ Unavailable nodes: {', '.join(unavailable)}"
+    return text
+
+def channel_browser_markup(sort, page, pages):
+    sort_row = [
+        InlineKeyboardButton(f"• {label}" if key == sort else label, callback_data=f'channels:{key}:0')
+        for key, (label, _) in CHANNEL_SORTS.items()
+    ]
+    page_row = []
+    if page > 0:
+        page_row.append(InlineKeyboardButton("⬅️ Prev", callback_data=f'channels:{sort}:{page - 1}'))
+    if page < pages - 1:
+        page_row.append(InlineKeyboardButton("Next ➡️", callback_data=f'channels:{sort}:{page + 1}'))
+    return InlineKeyboardMarkup([sort_row, page_row] if page_row else [sort_row])
+
+def newest(rows_by_node, key, count):
+    # The newest count rows over all nodes, oldest first, each paired with its node's name
+    rows = [(node.name, row) for node, rows in zip(nodes, rows_by_node) for row in rows]
+    return sorted(rows, key=lambda entry: entry[1][key])[-count:]
 
 async def get_recent_transactions(update):
     try:
-        stub = get_ln_stub()
-
-        # Fetch recent on-chain transactions
-        response_onchain = stub.GetTransactions(GetTransactionsRequest())
-        recent_onchain = response_onchain.transactions[-10:]  # Get the last 10 on-chain transactions
-
-        # Fetch recent Lightning invoices
-        response_invoices = stub.ListInvoices(ListInvoiceRequest(pending_only=False))
-        recent_invoices = response_invoices.invoices[-10:]  # Get the last 10 invoices
-
-        # Prepare on-chain transactions info
-        onchain_transactions = "\n".join([
-            f"₿ You have {'received' if tx.amount >= 0 else 'paid'} {abs(tx.amount)} satoshis via an on-chain transaction.\n"
-            f"   Date: {datetime.fromtimestamp(tx.time_stamp).strftime('%Y-%m-%d %H:%M:%S') if tx.time_stamp else 'Date not available'}"
-            for tx in recent_onchain
-        ])
-
-        # Prepare Lightning transactions info
-        lightning_transactions = "\n".join([
-            f"⚡ You have {'received' if invoice.amt_paid_sat >= 0 else 'paid'} {abs(invoice.amt_paid_sat)} satoshis via a Lightning invoice.\n"
-            f"   Memo: {invoice.memo}\n"
-            f"   Date: {datetime.fromtimestamp(invoice.settle_date).strftime('%Y-%m-%d %H:%M:%S') if invoice.settle_date else 'Date not available'}"
-            for invoice in recent_invoices
-        ])
-
-        # Prepare the response message
-        text = "Recent Transactions:\n"
-        text += onchain_transactions + "\n" if onchain_transactions else ""
-        text += lightning_transactions + "\n" if lightning_transactions else ""
-
-        await update.message.reply_text(text)
-    except grpc.RpcError as e:
-        logging.error(f"gRPC error while getting recent transactions: {e.details()}")
-        await update.message.reply_text(f"Error retrieving recent transactions: {e.details()}")
-
-async def get_forwarding_transactions(update):
+        # The first view may come before the on-chain watchers caught up, let them fetch by height once
+        await flights.do('recentonchain', lambda: gather_nodes(
+            nodes, lambda node: node.onchain_watcher.get_recent(), NODE_TIMEOUT))
+
+        # Everything else is read from the local stores
+        onchain_txs = newest([node.store.recent_onchain(RECENT_ONCHAIN) for node in nodes], 'time_stamp', RECENT_ONCHAIN)
+        invoices_by_node = [node.store.recent_invoices(RECENT_INVOICES) for node in nodes]
+        invoices = newest(invoices_by_node, 'creation_date', RECENT_INVOICES)
+        payments = newest([node.store.recent_payments(RECENT_PAYMENTS, Payment.SUCCEEDED) for node in nodes],
+                          'creation_time_ns', RECENT_PAYMENTS)
+
+        # Memos can be long, so the message may still need splitting
+        version = tuple((node.store.versions['onchain'], node.store.versions['invoices'], node.store.versions['payments'])
+                        for node in nodes)
+        chunks = view_cache.chunks('recenttransactions', version,
+                                   lambda: render_recent_transactions(onchain_txs, invoices, payments))
+        older_offsets = [(i, rows[0]['add_index']) for i, rows in enumerate(invoices_by_node) if rows]
+        await send_chunks(update.message, chunks, reply_markup=older_invoices_markup(older_offsets))
+    except sqlite3.Error as e:
+        logging.error(f"Error reading recent transactions: {e}")
+        await update.message.reply_text(f"Error retrieving recent transactions: {e}")
+
+def render_recent_transactions(onchain_txs, invoices, payments):
+    # Prepare on-chain transactions info
+    onchain_transactions = [
+        f"₿ {node_label(node_name)}You have {'received' if tx['amount'] >= 0 else 'paid'} {abs(tx['amount'])} satoshis via an on-chain transaction.\n"
+        f"   Date: {datetime.fromtimestamp(tx['time_stamp']).strftime('%Y-%m-%d %H:%M:%S') if tx['time_stamp'] else 'Date not available'}"
+        for node_name, tx in onchain_txs
+    ]
+
+    # Prepare Lightning transactions info
+    lightning_transactions = [format_invoice(node_name, invoice) for node_name, invoice in invoices]
+    lightning_payments = [
+        f"⚡ {node_label(node_name)}You have paid {payment['value_msat'] // 1000} satoshis via a Lightning payment.\n"
+        f"   Fee: {payment['fee_msat'] // 1000} satoshis\n"
+        f"   Date: {datetime.fromtimestamp(payment['creation_time_ns'] / 10 ** 9).strftime('%Y-%m-%d %H:%M:%S') if payment['creation_time_ns'] else 'Date not available'}"
+        for node_name, payment in payments
+    ]
+
+    return chunk_records("Recent Transactions:", onchain_transactions + lightning_transactions + lightning_payments)
+
+async def get_older_invoices(update, node_index, index_offset):
     try:
-        stub = get_ln_stub()
-        response = stub.ForwardingHistory(ForwardingHistoryRequest())
-        forwarding_info = "\n".join([
-            f"⚡ Forwarded {tx.amt_in} satoshis to {tx.pub_key}.\n"
-            f"   Fee: {tx.fee} satoshis\n"
-            f"   Date: {datetime.fromtimestamp(tx.timestamp).strftime('%Y-%m-%d %H:%M:%S') if tx.timestamp else 'Date not available'}"
-            for tx in response.forwarding_events
-        ])
-        await update.message.reply_text(f"Forwarding Transactions:\n{forwarding_info}")
-    except grpc.RpcError as e:
-        logging.error(f"gRPC error while getting forwarding transactions: {e.details()}")
-        await update.message.reply_text(f"Error retrieving forwarding transactions: {e.details()}")
+        node = nodes[node_index]
+        invoices = node.store.recent_invoices(RECENT_INVOICES, before_index=index_offset)
+        if not invoices:
+            await update.message.reply_text("No older invoices.")
+            return
+        await send_chunks(update.message,
+                          chunk_records("Older Lightning Invoices:",
+                                        (format_invoice(node.name, invoice) for invoice in invoices)),
+                          reply_markup=older_invoices_markup([(node_index, invoices[0]['add_index'])]))
+    except sqlite3.Error as e:
+        logging.error(f"Error reading older invoices: {e}")
+        await update.message.reply_text(f"Error retrieving older invoices: {e}")
 
-async def get_bitcoin_info(update):
+def format_invoice(node_name, invoice):
+    amt_paid_sat = invoice['amt_paid_msat'] // 1000
+    return (f"⚡ {node_label(node_name)}You have {'received' if amt_paid_sat >= 0 else 'paid'} {abs(amt_paid_sat)} satoshis via a Lightning invoice.\n"
+            f"   Memo: {invoice['memo']}\n"
+            f"   Date: {datetime.fromtimestamp(invoice['settle_date']).strftime('%Y-%m-%d %H:%M:%S') if invoice['settle_date'] else 'Date not available'}")
+
+def older_invoices_markup(offsets):
+    # One button per node that has older invoices; indexes start at 1, so there is nothing older than the first one
+    rows = [
+        [InlineKeyboardButton(f"⏪ Older invoices{f' ({nodes[node_index].name})' if len(nodes) > 1 else ''}",
+                              callback_data=f'olderinvoices:{node_index}:{index_offset}')]
+        for node_index, index_offset in offsets if index_offset > 1
+    ]
+    return InlineKeyboardMarkup(rows) if rows else None
+
+async def get_forwarding_transactions(update, since=None, before_ns=0):
     try:
-        btc_price_usd, btc_price_eur, fast_fee, half_hour_fee, hour_fee = get_bitcoin_price_and_fees()
-        if btc_price_usd is not None:
-            text = (f"💰 Bitcoin Price:\n"
-                    f"   - USD: ${btc_price_usd}\n"
-                    f"   - EUR: €{btc_price_eur}\n\n"
-                    f"💸 Network Fees:\n"
-                    f"   - Fastest Fee: {fast_fee} satoshis/byte\n"
-                    f"   - Half Hour Fee: {half_hour_fee} satoshis/byte\n"
-                    f"   - Hour Fee: {hour_fee} satoshis/byte")
-            await update.message.reply_text(text)
+        # The HTLC monitor keeps the store current, show the newest forwards of the last day from it.
+        # The window start is rounded to the minute so the rendered view can be reused.
+        if since is None:
+            since = (int(time.time()) // 60 * 60 - 24 * 3600) * 10 ** 9
+        # One more than shown per node tells whether there are older ones to offer
+        forwards = newest([node.store.recent_forwards(since, RECENT_FORWARDS + 1, before_ns) for node in nodes],
+                          'timestamp_ns', RECENT_FORWARDS + 1)
+        more = len(forwards) > RECENT_FORWARDS
+        forwards = forwards[-RECENT_FORWARDS:]
+        if before_ns and not forwards:
+            await update.message.reply_text("No older forwards.")
+            return
+        if before_ns:
+            chunks = render_forwards(forwards, "Older Forwarding Transactions:")
         else:
+            version = (tuple(node.store.versions['forwards'] for node in nodes), since)
+            chunks = view_cache.chunks('forwardingtransactions', version, lambda: render_forwards(forwards))
+        await send_chunks(update.message, chunks,
+                          reply_markup=older_forwards_markup(since, forwards[0][1]['timestamp_ns']) if more else None)
+    except sqlite3.Error as e:
+        logging.error(f"Error reading forwarding transactions: {e}")
+        await update.message.reply_text(f"Error retrieving forwarding transactions: {e}")
+
+def older_forwards_markup(since, before_ns):
+    return InlineKeyboardMarkup([[InlineKeyboardButton("⏪ Older forwards", callback_data=f'olderforwards:{since}:{before_ns}')]])
+
+def render_forwards(forwards, header="Forwarding Transactions:"):
+    forwarding_info = (
+        f"⚡ {node_label(node_name)}Forwarded {tx['amt_in_msat'] // 1000} satoshis to {tx['peer_alias_out'] or tx['chan_id_out']}.\n"
+        f"   Fee: {tx['fee_msat'] // 1000} satoshis\n"
+        f"   Date: {datetime.fromtimestamp(tx['timestamp_ns'] / 10 ** 9).strftime('%Y-%m-%d %H:%M:%S') if tx['timestamp_ns'] else 'Date not available'}"
+        for node_name, tx in forwards
+    )
+    return chunk_records(header, forwarding_info)
+
+async def get_routing_stats(update, days):
+    # numpy is only loaded once someone asks for routing stats
+    from analytics import forward_columns, RoutingStats, NS_PER_DAY, NS_PER_WEEK
+    try:
+        # Aggregated from the local forwarding history, rounded to the minute like the forwarding view
+        since = (int(time.time()) // 60 * 60 - days * 86400) * 10 ** 9
+        period, period_ns = ('day', NS_PER_DAY) if days <= 31 else ('week', NS_PER_WEEK)
+        version = (tuple(node.store.versions['forwards'] for node in nodes), since)
+        chunks = view_cache.chunks(f'routingstats:{days}', version, lambda: render_routing_stats(
+            RoutingStats(forward_columns(itertools.chain(*(node.store.forwards_since(since) for node in nodes))),
+                         period_ns),
+            days, period))
+        await send_chunks(update.message, chunks, reply_markup=routing_stats_markup(days))
+    except sqlite3.Error as e:
+        logging.error(f"Error reading forwarding history: {e}")
+        await update.message.reply_text(f"Error retrieving routing stats: {e}")
+
+def render_routing_stats(stats, days, period):
+    percentiles = " / ".join(f"{amt // 1000:.0f}" for amt in stats.volume_percentiles.values())
+    header = (f"📈 Routing Stats (last {days} days):\n"
+              f"   - Forwards: {stats.count}\n"
+              f"   - Volume: {stats.volume_msat // 1000} satoshis\n"
+              f"   - Fees Earned: {stats.fees_msat // 1000} satoshis\n"
+              f"   - Average Fee Rate: {stats.fee_rate_ppm:.0f} ppm")
+    if percentiles:
+        header += f"\n   - Forward Size p50/p90/p99: {percentiles} satoshis"
+
+    records = ["🏆 Top channels by fees:"] + [
+        f"   - {chan_id}: {fees // 1000} sat fees, {volume // 1000} sat volume, {ppm:.0f} ppm"
+        for chan_id, volume, fees, ppm in stats.top_channels
+    ]
+    records += ["👥 Top peers by fees:"] + [
+        f"   - {peer}: {fees // 1000} sat fees, {volume // 1000} sat volume, {ppm:.0f} ppm"
+        for peer, volume, fees, ppm in stats.top_peers
+    ]
+    # Periods are bucketed in UTC, so they are labelled in UTC too
+    records += [f"📅 Fees per {period} (UTC):"] + [
+        f"   - {datetime.fromtimestamp(start / 10 ** 9, timezone.utc).strftime('%Y-%m-%d')}: {fees // 1000} sat fees, {volume // 1000} sat volume"
+        for start, volume, fees in stats.periods
+    ]
+    return chunk_records(header, records)
+
+def routing_stats_markup(days):
+    return InlineKeyboardMarkup([[
+        InlineKeyboardButton(f"• {period} days" if period == days else f"{period} days", callback_data=f'routingstats:{period}')
+        for period in (7, 30, 365)
+    ]])
+
+async def get_bitcoin_info(update):
+    try:
+        market = await flights.do('bitcoininfo', market_data.get)
+        if market[0] is None and market[2] is None:
             await update.message.reply_text("Error retrieving Bitcoin price and fees.")
+            return
+        await update.message.reply_text(view_cache.get('bitcoininfo', market, lambda: render_bitcoin_info(*market)))
     except Exception as e:
         logging.error(f"Error retrieving Bitcoin info: {e}")
         await update.message.reply_text(f"Error retrieving Bitcoin info: {e}")
 
+def render_bitcoin_info(btc_price_usd, btc_price_eur, fast_fee, half_hour_fee, hour_fee):
+    # Show whichever half is available if one upstream failed
+    if btc_price_usd is not None:
+        text = (f"💰 Bitcoin Price:\n"
+                f"   - USD: ${btc_price_usd}\n"
+                f"   - EUR: €{btc_price_eur}\n\n")
+    else:
+        text = "💰 Bitcoin Price: not available\n\n"
+    if fast_fee is not None:
+        text += (f"💸 Network Fees:\n"
+                 f"   - Fastest Fee: {fast_fee} satoshis/byte\n"
+                 f"   - Half Hour Fee: {half_hour_fee} satoshis/byte\n"
+                 f"   - Hour Fee: {hour_fee} satoshis/byte")
+    else:
+        text += "💸 Network Fees: not available"
+    return text
+
+async def stats(update: Update, context):
+    await observe_handler('stats', show_stats(update))
+
+async def show_stats(update):
+    # Cache and throttling counters, to check that repeated taps are served cheaply
+    views = sorted(set(view_cache.hits) | set(view_cache.misses))
+    lines = [f"   - {view}: {view_cache.hits[view]} hits, {view_cache.misses[view]} misses" for view in views]
+    text = ("📈 View cache:\n" + ("\n".join(lines) if lines else "   - empty") + "\n"
+            f"🔁 Coalesced requests: {flights.coalesced}, served from last result: {flights.reused}\n"
+            f"🚦 Throttled taps: {rate_limiter.throttled}\n"
+            f"🔐 LND handshakes: {', '.join(f'{node_label(node.name)}{node.channel.handshakes}' for node in nodes)}")
+    await update.message.reply_text(text)
+
+async def post_init(application):
+    global metrics_server
+    if METRICS_ADDR:
+        host, port = METRICS_ADDR.rsplit(':', 1)
+        metrics_server = MetricsServer(REGISTRY, host, int(port))
+        try:
+            await metrics_server.start()
+        except OSError as e:
+            logging.error(f"Could not serve metrics on {METRICS_ADDR}: {e}")
+
+    # Warm the market data cache so the first Bitcoin Info tap is instant
+    market_data.refresh_in_background()
+
+    # Open each node's LND channel once, on the bot's event loop, and start its
+    # monitoring tasks; notifications need CHAT_ID
+    if not CHAT_ID:
+        logging.warning("CHAT_ID is not set, notifications are disabled")
+    for node in nodes:
+        if CHAT_ID:
+            node.set_notify(make_notify(application, node.name), forwards=NOTIFY_FORWARDS)
+        node.start()
+
+def make_notify(application, node_name):
+    async def notify(text):
+        await application.bot.send_message(chat_id=CHAT_ID, text=node_label(node_name) + text)
+    return notify
+
+async def post_shutdown(application):
+    for node in nodes:
+        await node.stop()
+    await market_data.close()
+    if metrics_server is not None:
+        await metrics_server.close()
+
 def main():
     # Setup the Telegram bot
-    application = Application.builder().token(TELEGRAM_TOKEN).build()
+    application = (Application.builder().token(TELEGRAM_TOKEN)
+                   .post_init(post_init).post_shutdown(post_shutdown).build())
 
     # Add handlers
     application.add_handler(CommandHandler('start', start))
+    application.add_handler(CommandHandler('stats', stats))
     application.add_handler(CallbackQueryHandler(button))
 
     # Run the bot
@@ -0,0 +1,123 @@
+import time
+import asyncio
+import logging
+import grpc
+import grpc.aio
+from lightning_pb2_grpc import LightningStub
+from router_pb2_grpc import RouterStub
+
+# Keep the connection to LND warm between button presses and let gRPC
+# handle transport-level reconnects with its own exponential backoff.
+CHANNEL_OPTIONS = [
+    ('grpc.keepalive_time_ms', 30000),
+    ('grpc.keepalive_timeout_ms', 10000),
+    ('grpc.keepalive_permit_without_calls', 1),
+    ('grpc.http2.max_pings_without_data', 0),
+    ('grpc.initial_reconnect_backoff_ms', 1000),
+    ('grpc.max_reconnect_backoff_ms', 30000),
+    ('grpc.max_receive_message_length', 50 * 1024 * 1024),
+]
+
+# Backoff applied when the channel itself cannot be (re)built, e.g. tls.cert missing
+MIN_REBUILD_BACKOFF = 1.0
+MAX_REBUILD_BACKOFF = 60.0
+
+
+class AsyncChannelManager:
+    """Owns a single long-lived grpc.aio channel to LND and the stubs shared by its callers.
+
+    The channel is bound to the event loop it is first used on, so it must be
+    created from inside that loop (e.g. in Application.post_init).
+    """
+
+    def __init__(self, host, cert_path, auth_plugin, options=CHANNEL_OPTIONS, interceptors=None):
+        self.host = host
+        self.cert_path = cert_path
+        self.auth_plugin = auth_plugin
+        self.options = options
+        self.interceptors = interceptors
+        self.handshakes = 0  # Number of times the channel reached READY from another state
+        self.rebuilds = 0
+        self._channel = None
+        self._stub = None
+        self._router_stub = None
+        self._watcher = None
+        self._state = None
+        self._failures = 0
+        self._retry_at = 0.0
+
+    def _credentials(self):
+        now = time.monotonic()
+        if now < self._retry_at:
+            raise ConnectionError(f"LND channel unavailable, retrying in {self._retry_at - now:.0f}s")
+        try:
+            if self.cert_path is None:
+                # No cert: a local (loopback or unix socket) LND, such as fake_lnd
+                transport = grpc.local_channel_credentials()
+            else:
+                with open(self.cert_path, 'rb') as f:
+                    transport = grpc.ssl_channel_credentials(f.read())
+            creds = grpc.composite_channel_credentials(
+                transport,
+                grpc.metadata_call_credentials(self.auth_plugin),
+            )
+        except Exception as e:
+            self._failures += 1
+            backoff = min(MIN_REBUILD_BACKOFF * 2 ** (self._failures - 1), MAX_REBUILD_BACKOFF)
+            self._retry_at = now + backoff
+            logging.error(f"Error creating LND channel to {self.host} (retry in {backoff:.0f}s): {e}")
+            raise
+        self._failures = 0
+        self._retry_at = 0.0
+        return creds
+
+    def _set_channel(self, channel):
+        self._channel = channel
+        self._stub = LightningStub(channel)
+        self._router_stub = RouterStub(channel)
+        self._state = None
+        self.rebuilds += 1
+        logging.info(f"LND channel created for {self.host}")
+
+    def _on_state_change(self, state):
+        # Every transition into READY is a fresh connection and therefore a TLS handshake
+        if state == grpc.ChannelConnectivity.READY and self._state != grpc.ChannelConnectivity.READY:
+            self.handshakes += 1
+            logging.info(f"LND channel ready (handshakes: {self.handshakes})")
+        elif state == grpc.ChannelConnectivity.TRANSIENT_FAILURE:
+            logging.warning(f"LND channel to {self.host} in transient failure, reconnecting")
+        self._state = state
+
+    def connect(self):
+        return self.get_stub()
+
+    def get_stub(self):
+        if self._stub is None:
+            channel = grpc.aio.secure_channel(self.host, self._credentials(), options=self.options,
+                                              interceptors=self.interceptors)
+            self._set_channel(channel)
+            self._watcher = asyncio.get_running_loop().create_task(self._watch(channel))
+        return self._stub
+
+    def get_router_stub(self):
+        # routerrpc is served on the same connection as the main Lightning service
+        self.get_stub()
+        return self._router_stub
+
+    async def close(self):
+        channel, watcher = self._channel, self._watcher
+        self._channel = None
+        self._stub = None
+        self._router_stub = None
+        self._watcher = None
+        if watcher is not None:
+            watcher.cancel()
+        if channel is not None:
+            await channel.close()
+
+    async def _watch(self, channel):
+        state = channel.get_state(try_to_connect=True)
+        while True:
+            self._on_state_change(state)
+            await channel.wait_for_state_change(state)
+            state = channel.get_state()
@@ -0,0 +1,60 @@
+import os
+import logging
+import threading
+import grpc
+
+# How often the macaroon file is stat()ed for changes
+MACAROON_POLL_INTERVAL = 10.0
+
+
+class MacaroonCredentials(grpc.AuthMetadataPlugin):
+    """Serves the macaroon as pre-encoded call metadata.
+
+    The file is read once and re-read only when a background poller sees its
+    inode or mtime change, so issuing an RPC never touches the filesystem.
+    """
+
+    def __init__(self, path, poll_interval=MACAROON_POLL_INTERVAL):
+        self.path = path
+        self.poll_interval = poll_interval
+        self.reloads = 0
+        self._signature = None
+        self._metadata = ()
+        self._stop = threading.Event()
+        self._poller = None
+        try:
+            self.reload()
+        except OSError as e:
+            logging.error(f"Error reading macaroon {self.path}: {e}")
+
+    def __call__(self, context, callback):
+        callback(self._metadata, None)
+
+    def reload(self):
+        st = os.stat(self.path)
+        signature = (st.st_ino, st.st_mtime_ns, st.st_size)
+        if signature == self._signature:
+            return False
+        with open(self.path, 'rb') as f:
+            macaroon_hex = f.read().hex()
+        # Swap the whole tuple so concurrent RPCs never see a partial update
+        self._metadata = (('macaroon', macaroon_hex),)
+        self._signature = signature
+        self.reloads += 1
+        return True
+
+    def start(self):
+        if self._poller is None:
+            self._poller = threading.Thread(target=self._poll, name='macaroon-poller', daemon=True)
+            self._poller.start()
+
+    def stop(self):
+        self._stop.set()
+
+    def _poll(self):
+        while not self._stop.wait(self.poll_interval):
+            try:
+                if self.reload():
+                    logging.info(f"Macaroon {self.path} changed, reloaded")
+            except OSError as e:
+                logging.error(f"Error checking macaroon {self.path}: {e}")
@@ -0,0 +1,141 @@
+import time
+import asyncio
+import logging
+import httpx
+from metrics import HTTP_LATENCY, HTTP_ERRORS, HTTP_RESPONSE_SIZE
+
+COINGECKO_URL = 'https://api.coingecko.com/api/v3/simple/price'
+MEMPOOL_FEES_URL = 'https://mempool.space/api/v1/fees/recommended'
+
+MARKET_TTL = 60  # Seconds a value is served without refreshing
+MARKET_MAX_STALE = 900  # Past this age a stale value is no longer served
+MIN_FAILURE_BACKOFF = 5.0  # Seconds an upstream is left alone after a failed fetch, doubled per failure
+MAX_FAILURE_BACKOFF = 300.0
+HTTP_TIMEOUT = httpx.Timeout(5.0, connect=3.0)
+REQUEST_DEADLINE = 6.0  # Hard cap on each request, including retries inside httpx
+
+
+class _Upstream:
+    """One upstream's cached value, refresh task and failure backoff."""
+
+    def __init__(self, name, fetch):
+        self.name = name
+        self.fetch = fetch
+        self.value = None
+        self.fetched_at = 0.0
+        self.failures = 0
+        self.retry_at = 0.0
+        self.task = None
+
+
+class MarketData:
+    """Bitcoin price and fee estimates with a TTL cache and stale-while-revalidate.
+
+    Price and fees are cached and refreshed separately, in the background, so a
+    slow or failing upstream only leaves its own half missing and never holds up
+    the other. A failing upstream is retried with exponential backoff. Callers
+    only wait for a fetch when neither half has anything to show yet.
+    """
+
+    def __init__(self, ttl=MARKET_TTL, max_stale=MARKET_MAX_STALE,
+                 timeout=HTTP_TIMEOUT, deadline=REQUEST_DEADLINE):
+        self.ttl = ttl
+        self.max_stale = max_stale
+        self.timeout = timeout
+        self.deadline = deadline
+        self._client = None  # Created on first use so it binds to the running loop
+        self._price = _Upstream('Bitcoin price', self._fetch_price)  # (usd, eur)
+        self._fees = _Upstream('network fees', self._fetch_fees)  # (fastest, half hour, hour)
+
+    async def get(self):
+        now = time.monotonic()
+        upstreams = (self._price, self._fees)
+        pending = [self._refresh(upstream) for upstream in upstreams
+                   if now - upstream.fetched_at > self.ttl and now >= upstream.retry_at]
+        if pending and all(self._servable(upstream, now) is None for upstream in upstreams):
+            # Nothing cached to show yet: wait for the first answers, without
+            # cancelling the shared refreshes if this caller goes away
+            await asyncio.wait(pending)
+            now = time.monotonic()
+        return (self._servable(self._price, now) or (None, None)) + (self._servable(self._fees, now) or (None, None, None))
+
+    def refresh_in_background(self):
+        for upstream in (self._price, self._fees):
+            self._refresh(upstream)
+
+    def _servable(self, upstream, now):
+        if upstream.value is None or now - upstream.fetched_at > self.max_stale:
+            return None
+        return upstream.value
+
+    def _refresh(self, upstream):
+        # At most one refresh per upstream is in flight, shared by every caller
+        if upstream.task is None or upstream.task.done():
+            upstream.task = asyncio.get_running_loop().create_task(self._update(upstream))
+        return upstream.task
+
+    async def _update(self, upstream):
+        value = await self._fetch(upstream.fetch, upstream.name)
+        now = time.monotonic()
+        if value is None:
+            upstream.failures += 1
+            backoff = min(MIN_FAILURE_BACKOFF * 2 ** (upstream.failures - 1), MAX_FAILURE_BACKOFF)
+            upstream.retry_at = now + backoff
+            logging.warning(f"Not fetching {upstream.name} again for {backoff:.0f}s")
+        else:
+            upstream.value, upstream.fetched_at = value, now
+            upstream.failures = 0
+            upstream.retry_at = 0.0
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _fetch(self, fetch, name):
+        try:
+            return await asyncio.wait_for(fetch(), self.deadline)
+        except Exception as e:
+            # Keep serving the previous value, if any
+            logging.error(f"Error fetching {name}: {e!r}")
+            return None
+
+    def _get_client(self):
+        if self._client is None:
+            # Keep-alive connections shared by every refresh
+            self._client = httpx.AsyncClient(timeout=self.timeout)
+        return self._client
+
+    async def _get(self, target, url, **kwargs):
+        labels = (target,)
+        start = time.perf_counter()
+        try:
+            response = await self._get_client().get(url, **kwargs)
+            response.raise_for_status()
+        except Exception:
+            HTTP_ERRORS.inc(labels)
+            raise
+        finally:
+            HTTP_LATENCY.observe(labels, time.perf_counter() - start)
+        HTTP_RESPONSE_SIZE.observe(labels, len(response.content))
+        return response
+
+    async def _fetch_price(self):
+        # Get Bitcoin price in USD and EUR
+        params = {
+            'ids': 'bitcoin',
+            'vs_currencies': 'usd,eur',
+            'include_market_cap': 'false',
+            'include_24hr_vol': 'false',
+            'include_24hr_change': 'false',
+            'include_last_updated_at': 'true'
+        }
+        response = await self._get('coingecko', COINGECKO_URL, params=params)
+        price_data = response.json()
+        return price_data['bitcoin']['usd'], price_data['bitcoin']['eur']
+
+    async def _fetch_fees(self):
+        # Get network fees from Mempool
+        response = await self._get('mempool', MEMPOOL_FEES_URL)
+        fees_data = response.json()
+        return fees_data['fastestFee'], fees_data['halfHourFee'], fees_data['hourFee']
@@ -0,0 +1,256 @@
+import time
+import asyncio
+import logging
+import grpc
+import grpc.aio
+
+# Upper bounds in seconds, from fast local RPCs up to slow full-history scans
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+# Upper bounds in bytes, from a GetInfo reply up to a full GetTransactions history
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216, 67108864)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _labels(names, values):
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values)) + "}"
+
+
+class Counter:
+    """Monotonic counter per label values."""
+
+    kind = 'counter'
+
+    def __init__(self, name, help, labelnames=()):
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self._values = {}  # label values -> count
+
+    def inc(self, labels=(), amount=1):
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    def totals(self):
+        # label values -> count, for reading the counter without a scrape
+        return dict(self._values)
+
+    def samples(self):
+        for labels, value in self._values.items():
+            yield f"{self.name}_total{_labels(self.labelnames, labels)} {value}"
+
+
+class Histogram:
+    """Cumulative bucket counts, sum and count per label values."""
+
+    kind = 'histogram'
+
+    def __init__(self, name, help, labelnames=(), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self.buckets = buckets
+        self._values = {}  # label values -> [bucket counts..., sum, count]
+
+    def observe(self, labels, value):
+        state = self._values.get(labels)
+        if state is None:
+            state = self._values[labels] = [0] * (len(self.buckets) + 2)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                state[i] += 1
+                break
+        state[-2] += value
+        state[-1] += 1
+
+    def totals(self):
+        # label values -> (count, sum), for reading the histogram without a scrape
+        return {labels: (state[-1], state[-2]) for labels, state in self._values.items()}
+
+    def samples(self):
+        names = self.labelnames + ('le',)
+        for labels, state in self._values.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets, state):
+                cumulative += count
+                yield f"{self.name}_bucket{_labels(names, labels + (bound,))} {cumulative}"
+            yield f"{self.name}_bucket{_labels(names, labels + ('+Inf',))} {state[-1]}"
+            yield f"{self.name}_sum{_labels(self.labelnames, labels)} {state[-2]}"
+            yield f"{self.name}_count{_labels(self.labelnames, labels)} {state[-1]}"
+
+
+class Gauge:
+    """Value read from a callback at scrape time, for counters kept elsewhere.
+
+    The callback returns (label values, value) pairs.
+    """
+
+    def __init__(self, name, help, labelnames, read, kind='gauge'):
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self.kind = kind
+        self._read = read
+
+    def samples(self):
+        suffix = '_total' if self.kind == 'counter' else ''
+        for labels, value in self._read():
+            yield f"{self.name}{suffix}{_labels(self.labelnames, labels)} {value}"
+
+
+class Registry:
+    """Metrics rendered together in the Prometheus text exposition format."""
+
+    def __init__(self):
+        self.metrics = []
+
+    def register(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def counter(self, name, help, labelnames=()):
+        return self.register(Counter(name, help, labelnames))
+
+    def histogram(self, name, help, labelnames=(), buckets=LATENCY_BUCKETS):
+        return self.register(Histogram(name, help, labelnames, buckets))
+
+    def gauge(self, name, help, labelnames, read, kind='gauge'):
+        return self.register(Gauge(name, help, labelnames, read, kind))
+
+    def render(self):
+        lines = []
+        for metric in self.metrics:
+            # Metadata is matched to samples by exact name, and counter samples carry the _total suffix
+            name = f"{metric.name}_total" if metric.kind == 'counter' else metric.name
+            lines.append(f"# HELP {name} {metric.help}")
+            lines.append(f"# TYPE {name} {metric.kind}")
+            try:
+                lines.extend(metric.samples())
+            except Exception as e:
+                logging.error(f"Error collecting metric {metric.name}: {e}")
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+RPC_LATENCY = REGISTRY.histogram('lnd_rpc_duration_seconds', "LND unary RPC latency.", ('node', 'method'))
+RPC_ERRORS = REGISTRY.counter('lnd_rpc_errors', "LND RPCs that failed, by status code.", ('node', 'method', 'code'))
+RPC_RETRIES = REGISTRY.counter('lnd_rpc_retries', "LND RPCs sent again after UNAVAILABLE.", ('node', 'method'))
+RPC_RESPONSE_SIZE = REGISTRY.histogram('lnd_rpc_response_bytes', "Serialized size of LND responses.",
+                                       ('node', 'method'), SIZE_BUCKETS)
+RPC_STREAM_MESSAGES = REGISTRY.counter('lnd_stream_messages', "Messages received on LND streams.", ('node', 'method'))
+RPC_STREAM_BYTES = REGISTRY.counter('lnd_stream_bytes', "Bytes received on LND streams.", ('node', 'method'))
+HTTP_LATENCY = REGISTRY.histogram('http_request_duration_seconds', "External HTTP request latency.", ('target',))
+HTTP_ERRORS = REGISTRY.counter('http_request_errors', "External HTTP requests that failed.", ('target',))
+HTTP_RESPONSE_SIZE = REGISTRY.histogram('http_response_bytes', "Size of external HTTP responses.",
+                                        ('target',), SIZE_BUCKETS)
+HANDLER_LATENCY = REGISTRY.histogram('telegram_handler_duration_seconds',
+                                     "End-to-end time to answer a Telegram command or button.", ('handler',))
+HANDLER_ERRORS = REGISTRY.counter('telegram_handler_errors', "Telegram handlers that raised.", ('handler',))
+
+
+async def observe_handler(handler, awaitable):
+    start = time.perf_counter()
+    try:
+        return await awaitable
+    except Exception:
+        HANDLER_ERRORS.inc((handler,))
+        raise
+    finally:
+        HANDLER_LATENCY.observe((handler,), time.perf_counter() - start)
+
+
+def method_name(client_call_details):
+    # '/lnrpc.Lightning/GetInfo' -> 'GetInfo'
+    method = client_call_details.method
+    method = method.decode() if isinstance(method, bytes) else method
+    return method.rsplit('/', 1)[-1]
+
+
+class UnaryMetricsInterceptor(grpc.aio.UnaryUnaryClientInterceptor):
+    """Records latency, response size and errors of every unary RPC on a node's channel."""
+
+    def __init__(self, node):
+        self.node = node
+
+    async def intercept_unary_unary(self, continuation, client_call_details, request):
+        labels = (self.node, method_name(client_call_details))
+        start = time.perf_counter()
+        try:
+            response = await (await continuation(client_call_details, request))
+        except grpc.aio.AioRpcError as e:
+            RPC_ERRORS.inc(labels + (e.code().name,))
+            raise
+        finally:
+            RPC_LATENCY.observe(labels, time.perf_counter() - start)
+        RPC_RESPONSE_SIZE.observe(labels, response.ByteSize())
+        return response
+
+
+class StreamMetricsInterceptor(grpc.aio.UnaryStreamClientInterceptor):
+    """Counts messages, bytes and errors of every server stream on a node's channel."""
+
+    def __init__(self, node):
+        self.node = node
+
+    async def intercept_unary_stream(self, continuation, client_call_details, request):
+        labels = (self.node, method_name(client_call_details))
+        call = await continuation(client_call_details, request)
+        return self._responses(labels, call)
+
+    async def _responses(self, labels, call):
+        try:
+            async for response in call:
+                RPC_STREAM_MESSAGES.inc(labels)
+                RPC_STREAM_BYTES.inc(labels, response.ByteSize())
+                yield response
+        except grpc.aio.AioRpcError as e:
+            RPC_ERRORS.inc(labels + (e.code().name,))
+            raise
+
+
+def metrics_interceptors(node):
+    return [UnaryMetricsInterceptor(node), StreamMetricsInterceptor(node)]
+
+
+class MetricsServer:
+    """Serves the registry on GET /metrics from a plain asyncio socket server."""
+
+    def __init__(self, registry=REGISTRY, host='127.0.0.1', port=9464):
+        self.registry = registry
+        self.host = host
+        self.port = port
+        self._server = None
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        logging.info(f"Serving metrics on http://{self.host}:{self.port}/metrics")
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _handle(self, reader, writer):
+        try:
+            request_line = await reader.readline()
+            # Skip the headers, nothing in them matters here
+            while (await reader.readline()).strip():
+                pass
+            parts = request_line.decode('latin-1').split()
+            if len(parts) >= 2 and parts[0] == 'GET' and parts[1].split('?')[0] == '/metrics':
+                status, body = "200 OK", self.registry.render().encode()
+                content_type = "text/plain; version=0.0.4; charset=utf-8"
+            else:
+                status, body, content_type = "404 Not Found", b"Not found\n", "text/plain"
+            writer.write(f"HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n"
+                         f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode() + body)
+            await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
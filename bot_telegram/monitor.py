@@ -0,0 +1,58 @@
+import asyncio
+import logging
+
+MIN_RETRY_DELAY = 1.0
+MAX_RETRY_DELAY = 60.0
+
+
+class StreamMonitor:
+    """Consumes a server-streaming LND RPC on the event loop and resubscribes with backoff.
+
+    Subclasses implement subscribe(stub), returning the stream, and handle(item)
+    for each received message.
+    """
+
+    name = 'stream'
+
+    def __init__(self, get_stub):
+        self.get_stub = get_stub
+        self.events = 0
+        self._task = None
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run(), name=f'{self.name}-monitor')
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def subscribe(self, stub):
+        raise NotImplementedError
+
+    async def handle(self, item):
+        raise NotImplementedError
+
+    async def _run(self):
+        delay = MIN_RETRY_DELAY
+        while True:
+            try:
+                stream = await self.subscribe(self.get_stub())
+                logging.info(f"Subscribed to {self.name} events")
+                async for item in stream:
+                    delay = MIN_RETRY_DELAY
+                    self.events += 1
+                    await self.handle(item)
+                logging.warning(f"{self.name} stream ended, resubscribing")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                details = e.details() if hasattr(e, 'details') else e
+                logging.error(f"Error in {self.name} monitor (retry in {delay:.0f}s): {details}")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, MAX_RETRY_DELAY)
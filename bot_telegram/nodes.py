@@ -0,0 +1,102 @@
+import json
+import asyncio
+import logging
+from lnd_channel import AsyncChannelManager
+from lnd_credentials import MacaroonCredentials
+from store import Store
+from onchain import OnchainWatcher, RecentOnchain
+from channels import ChannelMirror
+from forwards import HtlcMonitor
+from invoices import InvoiceMonitor
+from payments import PaymentMonitor
+from interceptors import client_interceptors
+
+
+class Node:
+    """Everything the bot keeps per LND node.
+
+    Each node has its own macaroon, pooled grpc.aio channel, event store and
+    stream monitors, so one node going down leaves the others untouched.
+    """
+
+    def __init__(self, name, host, cert_path, macaroon_path, store_path):
+        self.name = name
+        self.macaroon = MacaroonCredentials(macaroon_path)
+        # Every RPC on the channel goes through the interceptor chain: metrics, slow-call
+        # logging, default deadlines and retries of idempotent calls
+        self.channel = AsyncChannelManager(host, cert_path, self.macaroon, interceptors=client_interceptors(name))
+        self.store = Store(store_path)
+        self.onchain_watcher = OnchainWatcher(self.get_stub, RecentOnchain(store=self.store))
+        self.channel_mirror = ChannelMirror(self.get_stub)
+        self.htlc_monitor = HtlcMonitor(self.get_router_stub, self.get_stub, self.store)
+        self.invoice_monitor = InvoiceMonitor(self.get_stub, self.store)
+        self.payment_monitor = PaymentMonitor(self.get_router_stub, self.get_stub, self.store)
+        self.monitors = [self.channel_mirror, self.onchain_watcher, self.htlc_monitor,
+                         self.invoice_monitor, self.payment_monitor]
+        self._flusher = None
+
+    def get_stub(self):
+        return self.channel.get_stub()
+
+    def get_router_stub(self):
+        return self.channel.get_router_stub()
+
+    def set_notify(self, notify, forwards=False):
+        # A routing node can settle several forwards a second, so they are only announced on request
+        for monitor in self.monitors:
+            if hasattr(monitor, 'notify') and (forwards or monitor is not self.htlc_monitor):
+                monitor.notify = notify
+
+    def start(self):
+        self.macaroon.start()
+        try:
+            self.channel.connect()
+        except Exception as e:
+            logging.error(f"Could not connect to LND node {self.name} at startup: {e}")
+        # Buffered event store writes are committed in the background
+        self._flusher = asyncio.get_running_loop().create_task(self.store.flush_periodically())
+        for monitor in self.monitors:
+            monitor.start()
+
+    async def stop(self):
+        for monitor in self.monitors:
+            await monitor.stop()
+        self.macaroon.stop()
+        await self.channel.close()
+        if self._flusher is not None:
+            self._flusher.cancel()
+        self.store.close()
+
+
+def load_nodes(config, default, store_path):
+    # config is a JSON list of {"name", "host", "cert", "macaroon"} objects, a null cert meaning a
+    # local connection without TLS (e.g. to fake_lnd). Without it the
+    # single default (name, host, cert, macaroon) node is used with the store at store_path;
+    # configured nodes each get their own store next to it.
+    if not config:
+        name, host, cert_path, macaroon_path = default
+        return [Node(name, host, cert_path, macaroon_path, store_path)]
+    base, ext = store_path.rsplit('.', 1)
+    return [Node(entry['name'], entry['host'], entry.get('cert'), entry['macaroon'], f"{base}-{entry['name']}.{ext}")
+            for entry in json.loads(config)]
+
+
+async def gather_nodes(nodes, fn, timeout):
+    # Run fn(node) on all nodes concurrently. A node that fails or takes longer than
+    # timeout yields its exception instead of a result, without holding up the others.
+    async def run(node):
+        try:
+            return await asyncio.wait_for(fn(node), timeout)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logging.error(f"Error querying LND node {node.name}: {node_error(e)}")
+            return e
+
+    return await asyncio.gather(*(run(node) for node in nodes))
+
+
+def node_error(e):
+    if isinstance(e, asyncio.TimeoutError):
+        return "timed out"
+    return e.details() if hasattr(e, 'details') else str(e)
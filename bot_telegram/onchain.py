@@ -0,0 +1,128 @@
+import asyncio
+import logging
+from lightning_pb2 import GetInfoRequest, GetTransactionsRequest
+from monitor import StreamMonitor
+
+RECENT_ONCHAIN = 10
+INITIAL_WINDOW = 1008  # Blocks (about a week) scanned back from the tip on the first view
+REORG_MARGIN = 6  # Blocks re-read below the last synced height on later views
+NOTIFY_DEBOUNCE = 30  # Seconds updates for a transaction are coalesced before notifying
+
+
+class RecentOnchain:
+    """Keeps the newest on-chain wallet transactions without scanning the whole history.
+
+    The first fetch reads backwards from the chain tip in growing height windows
+    until enough transactions are found; later fetches only ask LND for blocks
+    mined since the previous one (plus unconfirmed transactions). Every new or
+    changed transaction is also recorded in the store, if one is given.
+    """
+
+    def __init__(self, count=RECENT_ONCHAIN, window=INITIAL_WINDOW, store=None):
+        self.count = count
+        self.window = window
+        self.store = store
+        self.synced_height = None
+        self.version = 0  # Bumped whenever the cached transactions change
+        self._txs = {}  # tx_hash -> Transaction
+
+    async def fetch(self, stub):
+        tip = (await stub.GetInfo(GetInfoRequest())).block_height
+        if self.synced_height is None:
+            await self._backfill(stub, tip)
+        else:
+            self.merge(await self._get(stub, max(self.synced_height - REORG_MARGIN, 0), -1))
+        self.synced_height = tip
+        return self.recent()
+
+    def recent(self):
+        # Unconfirmed transactions have no block yet, order them by time like the rest
+        txs = sorted(self._txs.values(), key=lambda tx: tx.time_stamp)
+        return txs[-self.count:]
+
+    async def _backfill(self, stub, tip):
+        window = self.window
+        high = -1  # -1 includes unconfirmed transactions up to the tip
+        low = max(tip - window + 1, 0)
+        while True:
+            self.merge(await self._get(stub, low, high))
+            if len(self._txs) >= self.count or low == 0:
+                break
+            # Widen the window and read only the blocks below what we already have
+            window *= 2
+            high = low - 1
+            low = max(high - window + 1, 0)
+
+    async def _get(self, stub, start_height, end_height):
+        response = await stub.GetTransactions(GetTransactionsRequest(start_height=start_height, end_height=end_height))
+        return response.transactions
+
+    def merge(self, transactions):
+        changed = [tx for tx in transactions if self._txs.get(tx.tx_hash) != tx]
+        for tx in changed:
+            self._txs[tx.tx_hash] = tx
+            self.version += 1
+        if changed and self.store is not None:
+            self.store.add_onchain(changed)
+        # Only the newest transactions are ever shown, drop the rest
+        if len(self._txs) > self.count:
+            self._txs = {tx.tx_hash: tx for tx in self.recent()}
+
+
+class OnchainWatcher(StreamMonitor):
+    """Keeps RecentOnchain current from SubscribeTransactions and notifies about it.
+
+    The cache is caught up by height on every (re)subscription, after that only
+    streamed transactions update it. Updates for the same transaction within
+    NOTIFY_DEBOUNCE seconds (e.g. seen in the mempool, then confirmed) produce a
+    single notification with its latest state.
+    """
+
+    name = 'on-chain'
+
+    def __init__(self, get_stub, recent=None, notify=None, debounce=NOTIFY_DEBOUNCE):
+        super().__init__(get_stub)
+        self.recent = recent or RecentOnchain()
+        self.notify = notify
+        self.debounce = debounce
+        self._pending = {}  # tx_hash -> latest Transaction waiting to be notified
+        self._notified = {}  # tx_hash -> whether it was confirmed when last notified
+
+    async def get_recent(self, stub=None):
+        # Only scan by height until the stream is up, then serve the cache as is
+        if self.recent.synced_height is None:
+            return await self.recent.fetch(stub or self.get_stub())
+        return self.recent.recent()
+
+    async def subscribe(self, stub):
+        stream = stub.SubscribeTransactions(GetTransactionsRequest())
+        await self.recent.fetch(stub)
+        return stream
+
+    async def handle(self, tx):
+        self.recent.merge([tx])
+        if self.notify is None:
+            return
+        if tx.tx_hash not in self._pending:
+            asyncio.get_running_loop().call_later(self.debounce, self._flush, tx.tx_hash)
+        self._pending[tx.tx_hash] = tx
+
+    def _flush(self, tx_hash):
+        tx = self._pending.pop(tx_hash)
+        confirmed = tx.num_confirmations > 0
+        if self._notified.get(tx_hash) == confirmed:
+            return
+        self._notified[tx_hash] = confirmed
+        if len(self._notified) > 10 * self.recent.count:
+            self._notified.pop(next(iter(self._notified)))
+        status = f"confirmed in block {tx.block_height}" if confirmed else "unconfirmed"
+        asyncio.get_running_loop().create_task(self._send(
+            f"₿ You have {'received' if tx.amount >= 0 else 'paid'} {abs(tx.amount)} satoshis "
+            f"via an on-chain transaction ({status})."
+        ))
+
+    async def _send(self, text):
+        try:
+            await self.notify(text)
+        except Exception as e:
+            logging.error(f"Error sending on-chain notification: {e}")
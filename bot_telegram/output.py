@@ -0,0 +1,49 @@
+import asyncio
+import logging
+from telegram.error import RetryAfter
+
+TELEGRAM_MESSAGE_LIMIT = 4096
+MAX_SEND_ATTEMPTS = 3
+
+
+def chunk_records(header, records, limit=TELEGRAM_MESSAGE_LIMIT):
+    # Pack rendered records into messages below Telegram's limit, only splitting between
+    # records. records may be a generator: each chunk is yielded as soon as it is full.
+    chunk = header
+    for record in records:
+        if len(record) > limit:
+            # A single record that can't fit anywhere is cut, which no real record should hit
+            record = record[:limit - 1] + "…"
+        candidate = f"{chunk}\n{record}" if chunk else record
+        if len(candidate) > limit:
+            yield chunk
+            chunk = record
+        else:
+            chunk = candidate
+    if chunk:
+        yield chunk
+
+
+async def send_chunks(message, chunks, **kwargs):
+    # Send chunks in order, each only after the previous one was accepted. kwargs such
+    # as reply_markup go with the last chunk, so one chunk is held back until the next exists.
+    previous = None
+    for chunk in chunks:
+        if previous is not None:
+            await send_text(message, previous)
+        previous = chunk
+    if previous is not None:
+        await send_text(message, previous, **kwargs)
+
+
+async def send_text(message, text, **kwargs):
+    for attempt in range(1, MAX_SEND_ATTEMPTS + 1):
+        try:
+            return await message.reply_text(text, **kwargs)
+        except RetryAfter as e:
+            if attempt == MAX_SEND_ATTEMPTS:
+                raise
+            delay = e.retry_after
+            delay = delay.total_seconds() if hasattr(delay, 'total_seconds') else delay
+            logging.warning(f"Telegram flood control, retrying in {delay}s")
+            await asyncio.sleep(delay)
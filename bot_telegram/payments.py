@@ -0,0 +1,58 @@
+from lightning_pb2 import ListPaymentsRequest, Payment
+from router_pb2 import TrackPaymentsRequest
+from monitor import StreamMonitor
+
+RECENT_PAYMENTS = 10
+PAYMENTS_PAGE_SIZE = 1000
+
+
+async def sync_payments(stub, store, page_size=PAYMENTS_PAGE_SIZE):
+    # Page forwards through the payments made since the stored payment index. The cursor is
+    # written once at the end, just before the oldest payment still in flight, so the next
+    # sync reads it again and records how it ended even if that happened while offline.
+    offset = store.get_cursor('payments')
+    resume = None
+    fetched = 0
+    while True:
+        response = await stub.ListPayments(ListPaymentsRequest(
+            include_incomplete=True, index_offset=offset, max_payments=page_size,
+        ))
+        payments = response.payments
+        if not payments:
+            break
+        store.add_payments(payments)
+        if resume is None:
+            in_flight = [payment.payment_index for payment in payments
+                         if payment.status in (Payment.IN_FLIGHT, Payment.INITIATED)]
+            if in_flight:
+                resume = min(in_flight) - 1
+        offset = response.last_index_offset
+        fetched += len(payments)
+        if len(payments) < page_size:
+            break
+    store.reset_cursor('payments', offset if resume is None else resume)
+    return fetched
+
+
+class PaymentMonitor(StreamMonitor):
+    """Records outgoing payments in the store from routerrpc TrackPayments.
+
+    Only final updates are streamed (no_inflight_updates), and only for payments
+    in flight when the subscription starts; payments made, or resolved, while
+    the bot was offline are caught up from ListPayments on every subscription.
+    """
+
+    name = 'payment'
+
+    def __init__(self, get_stub, get_ln_stub, store):
+        super().__init__(get_stub)
+        self.get_ln_stub = get_ln_stub
+        self.store = store
+
+    async def subscribe(self, stub):
+        stream = stub.TrackPayments(TrackPaymentsRequest(no_inflight_updates=True))
+        await sync_payments(self.get_ln_stub(), self.store)
+        return stream
+
+    async def handle(self, payment):
+        self.store.add_payments([payment])
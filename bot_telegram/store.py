@@ -0,0 +1,273 @@
+import asyncio
+import logging
+import sqlite3
+from collections import Counter
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS cursors (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS forwards (
+    idx INTEGER PRIMARY KEY,  -- LND forwarding log index (1-based)
+    timestamp_ns INTEGER NOT NULL,
+    chan_id_in INTEGER NOT NULL,
+    chan_id_out INTEGER NOT NULL,
+    amt_in_msat INTEGER NOT NULL,
+    amt_out_msat INTEGER NOT NULL,
+    fee_msat INTEGER NOT NULL,
+    peer_alias_in TEXT,
+    peer_alias_out TEXT
+);
+-- Forwards seen live on SubscribeHtlcEvents, not yet covered by the forwarding log
+CREATE TABLE IF NOT EXISTS live_forwards (
+    timestamp_ns INTEGER NOT NULL,
+    chan_id_in INTEGER NOT NULL,
+    chan_id_out INTEGER NOT NULL,
+    amt_in_msat INTEGER NOT NULL,
+    amt_out_msat INTEGER NOT NULL,
+    fee_msat INTEGER NOT NULL,
+    peer_alias_in TEXT,
+    peer_alias_out TEXT
+);
+CREATE TABLE IF NOT EXISTS forward_failures (
+    timestamp_ns INTEGER NOT NULL,
+    chan_id_in INTEGER NOT NULL,
+    chan_id_out INTEGER NOT NULL,
+    amt_in_msat INTEGER NOT NULL,
+    amt_out_msat INTEGER NOT NULL,
+    reason TEXT
+);
+CREATE TABLE IF NOT EXISTS invoices (
+    add_index INTEGER PRIMARY KEY,
+    settle_index INTEGER NOT NULL,
+    r_hash TEXT NOT NULL,
+    memo TEXT,
+    value_msat INTEGER NOT NULL,
+    amt_paid_msat INTEGER NOT NULL,
+    state INTEGER NOT NULL,
+    creation_date INTEGER NOT NULL,
+    settle_date INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS payments (
+    payment_index INTEGER PRIMARY KEY,
+    payment_hash TEXT NOT NULL,
+    value_msat INTEGER NOT NULL,
+    fee_msat INTEGER NOT NULL,
+    status INTEGER NOT NULL,
+    creation_time_ns INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS onchain (
+    tx_hash TEXT PRIMARY KEY,
+    amount INTEGER NOT NULL,
+    total_fees INTEGER NOT NULL,
+    block_height INTEGER NOT NULL,
+    time_stamp INTEGER NOT NULL,
+    label TEXT
+);
+CREATE INDEX IF NOT EXISTS forwards_timestamp ON forwards (timestamp_ns);
+CREATE INDEX IF NOT EXISTS forwards_chan_in ON forwards (chan_id_in);
+CREATE INDEX IF NOT EXISTS forwards_chan_out ON forwards (chan_id_out);
+CREATE INDEX IF NOT EXISTS forwards_peer_in ON forwards (peer_alias_in);
+CREATE INDEX IF NOT EXISTS forwards_peer_out ON forwards (peer_alias_out);
+CREATE INDEX IF NOT EXISTS live_forwards_timestamp ON live_forwards (timestamp_ns);
+CREATE INDEX IF NOT EXISTS forward_failures_timestamp ON forward_failures (timestamp_ns);
+CREATE INDEX IF NOT EXISTS invoices_settle_date ON invoices (settle_date);
+CREATE INDEX IF NOT EXISTS payments_creation_time ON payments (creation_time_ns);
+CREATE INDEX IF NOT EXISTS onchain_time_stamp ON onchain (time_stamp);
+"""
+
+FORWARD_COLUMNS = ("timestamp_ns, chan_id_in, chan_id_out, amt_in_msat, amt_out_msat, "
+                   "fee_msat, peer_alias_in, peer_alias_out")
+
+INSERT_LIVE_FORWARD = f"INSERT INTO live_forwards ({FORWARD_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, NULL, NULL)"
+INSERT_FORWARD_FAILURE = "INSERT INTO forward_failures VALUES (?, ?, ?, ?, ?, ?)"
+UPSERT_INVOICE = "INSERT OR REPLACE INTO invoices VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+UPSERT_PAYMENT = "INSERT OR REPLACE INTO payments VALUES (?, ?, ?, ?, ?, ?)"
+UPSERT_ONCHAIN = "INSERT OR REPLACE INTO onchain VALUES (?, ?, ?, ?, ?, ?)"
+
+BATCH_SIZE = 500  # Buffered rows that force a flush
+FLUSH_INTERVAL = 1.0  # Seconds between background flushes
+
+
+class Store:
+    """Local SQLite event store for invoices, payments, on-chain transactions and forwards.
+
+    Streamed events are buffered and written in batches, one transaction per
+    flush; every read flushes first so it sees everything ingested so far.
+    versions counts changes per table so views can tell when to re-render.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        # WAL lets reads proceed while a batch is being written
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(SCHEMA)
+        self.versions = Counter()
+        self._pending = {}  # statement -> buffered rows
+        self._pending_rows = 0
+
+    def close(self):
+        self.flush()
+        self._db.close()
+
+    def flush(self):
+        if not self._pending:
+            return
+        pending, self._pending, self._pending_rows = self._pending, {}, 0
+        with self._db:
+            for statement, rows in pending.items():
+                self._db.executemany(statement, rows)
+
+    async def flush_periodically(self, interval=FLUSH_INTERVAL):
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                self.flush()
+            except sqlite3.Error as e:
+                logging.error(f"Error writing to event store: {e}")
+
+    def _queue(self, table, statement, rows):
+        self._pending.setdefault(statement, []).extend(rows)
+        self._pending_rows += len(rows)
+        self.versions[table] += 1
+        if self._pending_rows >= BATCH_SIZE:
+            self.flush()
+
+    def get_cursor(self, name, default=0):
+        row = self._db.execute("SELECT value FROM cursors WHERE name = ?", (name,)).fetchone()
+        return row['value'] if row else default
+
+    def set_cursor(self, name, value):
+        # Rows buffered before the cursor moved are written in the same transaction
+        self.flush()
+        with self._db:
+            self._set_cursor(name, value)
+
+    def reset_cursor(self, name, value):
+        # Unlike set_cursor, may move the cursor back, for syncs that resume before rows they must re-read
+        self.flush()
+        with self._db:
+            self._db.execute(
+                "INSERT INTO cursors (name, value) VALUES (?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET value = excluded.value",
+                (name, value),
+            )
+
+    def _set_cursor(self, name, value):
+        # Cursors only move forward, so a late concurrent sync can't rewind them
+        self._db.execute(
+            "INSERT INTO cursors (name, value) VALUES (?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET value = max(value, excluded.value)",
+            (name, value),
+        )
+
+    def add_forwards(self, events, first_index, last_index):
+        rows = [
+            (first_index + i, event.timestamp_ns, event.chan_id_in, event.chan_id_out,
+             event.amt_in_msat, event.amt_out_msat, event.fee_msat,
+             event.peer_alias_in, event.peer_alias_out)
+            for i, event in enumerate(events)
+        ]
+        self.flush()
+        with self._db:
+            self._db.executemany("INSERT OR IGNORE INTO forwards VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            self._set_cursor('forwards', last_index)
+        self.versions['forwards'] += 1
+
+    def add_live_forward(self, timestamp_ns, chan_id_in, chan_id_out, amt_in_msat, amt_out_msat):
+        self._queue('forwards', INSERT_LIVE_FORWARD, [
+            (timestamp_ns, chan_id_in, chan_id_out, amt_in_msat, amt_out_msat, amt_in_msat - amt_out_msat),
+        ])
+
+    def add_forward_failure(self, timestamp_ns, chan_id_in, chan_id_out, amt_in_msat, amt_out_msat, reason):
+        self._queue('forward_failures', INSERT_FORWARD_FAILURE, [
+            (timestamp_ns, chan_id_in, chan_id_out, amt_in_msat, amt_out_msat, reason),
+        ])
+
+    def add_invoices(self, invoices):
+        self._queue('invoices', UPSERT_INVOICE, [
+            (invoice.add_index, invoice.settle_index, invoice.r_hash.hex(), invoice.memo,
+             invoice.value_msat, invoice.amt_paid_msat, invoice.state,
+             invoice.creation_date, invoice.settle_date)
+            for invoice in invoices
+        ])
+
+    def add_payments(self, payments):
+        self._queue('payments', UPSERT_PAYMENT, [
+            (payment.payment_index, payment.payment_hash, payment.value_msat,
+             payment.fee_msat, payment.status, payment.creation_time_ns)
+            for payment in payments
+        ])
+
+    def add_onchain(self, transactions):
+        self._queue('onchain', UPSERT_ONCHAIN, [
+            (tx.tx_hash, tx.amount, tx.total_fees, tx.block_height, tx.time_stamp, tx.label)
+            for tx in transactions
+        ])
+
+    def prune_live_forwards(self):
+        # Live rows up to the newest forwarding log entry are now covered by the log itself
+        self.flush()
+        with self._db:
+            self._db.execute(
+                "DELETE FROM live_forwards WHERE timestamp_ns <= "
+                "(SELECT coalesce(max(timestamp_ns), 0) FROM forwards)"
+            )
+
+    def forwards_since(self, timestamp_ns):
+        self.flush()
+        return self._db.execute(
+            f"SELECT {FORWARD_COLUMNS} FROM forwards WHERE timestamp_ns >= ? "
+            f"UNION ALL SELECT {FORWARD_COLUMNS} FROM live_forwards WHERE timestamp_ns >= ? "
+            "AND timestamp_ns > (SELECT coalesce(max(timestamp_ns), 0) FROM forwards) "
+            "ORDER BY timestamp_ns",
+            (timestamp_ns, timestamp_ns),
+        )
+
+    def recent_forwards(self, timestamp_ns, limit, before_ns=0):
+        # Newest forwards since timestamp_ns (optionally older than before_ns), returned oldest first
+        self.flush()
+        rows = self._db.execute(
+            f"SELECT {FORWARD_COLUMNS} FROM forwards WHERE timestamp_ns >= ? AND (? = 0 OR timestamp_ns < ?) "
+            f"UNION ALL SELECT {FORWARD_COLUMNS} FROM live_forwards WHERE timestamp_ns >= ? AND (? = 0 OR timestamp_ns < ?) "
+            "AND timestamp_ns > (SELECT coalesce(max(timestamp_ns), 0) FROM forwards) "
+            "ORDER BY timestamp_ns DESC LIMIT ?",
+            (timestamp_ns, before_ns, before_ns, timestamp_ns, before_ns, before_ns, limit),
+        ).fetchall()
+        return rows[::-1]
+
+    def recent_invoices(self, limit, before_index=0):
+        # Newest invoices (optionally older than before_index), returned oldest first
+        self.flush()
+        rows = self._db.execute(
+            "SELECT * FROM invoices WHERE ? = 0 OR add_index < ? ORDER BY add_index DESC LIMIT ?",
+            (before_index, before_index, limit),
+        ).fetchall()
+        return rows[::-1]
+
+    def invoice_indexes(self, states):
+        # add_index of the stored invoices in any of the given states
+        self.flush()
+        rows = self._db.execute(
+            f"SELECT add_index FROM invoices WHERE state IN ({', '.join('?' * len(states))})", tuple(states),
+        ).fetchall()
+        return [row['add_index'] for row in rows]
+
+    def recent_payments(self, limit, status):
+        self.flush()
+        rows = self._db.execute(
+            "SELECT * FROM payments WHERE status = ? ORDER BY creation_time_ns DESC LIMIT ?",
+            (status, limit),
+        ).fetchall()
+        return rows[::-1]
+
+    def recent_onchain(self, limit):
+        self.flush()
+        rows = self._db.execute(
+            "SELECT * FROM onchain ORDER BY time_stamp DESC LIMIT ?", (limit,)
+        ).fetchall()
+        return rows[::-1]
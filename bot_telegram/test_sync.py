@@ -0,0 +1,126 @@
+import os
+import asyncio
+import tempfile
+import unittest
+import grpc
+import grpc.aio
+import lightning_pb2 as ln
+from lightning_pb2_grpc import LightningStub
+from fake_lnd import FakeLnd, FakeNodeData
+from store import Store
+from invoices import InvoiceMonitor
+from payments import sync_payments
+
+BACKLOG_WAIT = 0.5  # Seconds without a stream message after which the backlog counts as replayed
+
+
+class SyncAcrossRestartsTest(unittest.IsolatedAsyncioTestCase):
+    """Changes made on the node while the bot is down are picked up on the next run."""
+
+    async def asyncSetUp(self):
+        self.lnd = None
+        await self.serve(FakeNodeData(channels=2, invoices=20, payments=20, transactions=1, forwards=1))
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store_path = os.path.join(self.tmp.name, 'test.db')
+
+    async def serve(self, data):
+        # Point the test at a fake node serving data, in place of the one it had
+        if self.lnd is not None:
+            await self.channel.close()
+            await self.lnd.stop()
+        self.data = data
+        self.lnd = FakeLnd(data)
+        address = await self.lnd.start()
+        self.channel = grpc.aio.secure_channel(address, grpc.local_channel_credentials(grpc.LocalConnectionType.LOCAL_TCP))
+        self.stub = LightningStub(self.channel)
+
+    async def asyncTearDown(self):
+        await self.channel.close()
+        await self.lnd.stop()
+        self.tmp.cleanup()
+
+    async def run_invoice_monitor(self):
+        # One bot run: subscribe (catching up), handle the stream's backlog, stop
+        notifications = []
+
+        async def notify(text):
+            notifications.append(text)
+
+        store = Store(self.store_path)
+        monitor = InvoiceMonitor(lambda: self.stub, store, notify)
+        stream = await monitor.subscribe(self.stub)
+        try:
+            while True:
+                invoice = await asyncio.wait_for(stream.read(), BACKLOG_WAIT)
+                await monitor.handle(invoice)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            stream.cancel()
+        open_indexes = store.invoice_indexes((ln.Invoice.OPEN, ln.Invoice.ACCEPTED))
+        settle_index = store.get_cursor('invoice_settle_index')
+        store.close()
+        return notifications, open_indexes, settle_index
+
+    async def test_invoice_settled_between_runs(self):
+        notifications, open_indexes, settle_index = await self.run_invoice_monitor()
+        self.assertEqual(notifications, [])
+        self.assertEqual(settle_index, self.data.settled)
+
+        invoice = next(invoice for invoice in self.data.invoices if invoice.state == ln.Invoice.OPEN)
+        self.assertIn(invoice.add_index, open_indexes)
+        self.data.settle_invoice(invoice)
+
+        notifications, open_indexes, settle_index = await self.run_invoice_monitor()
+        self.assertEqual(len(notifications), 1)
+        self.assertIn(invoice.memo, notifications[0])
+        self.assertNotIn(invoice.add_index, open_indexes)
+        self.assertEqual(settle_index, invoice.settle_index)
+
+    async def test_first_settlements_between_runs(self):
+        # With nothing settled yet LND has no settle backlog to replay, only the re-read finds these
+        data = FakeNodeData(channels=2, invoices=0, payments=0, transactions=0, forwards=0)
+        await self.serve(data)
+        invoices = [data.add_invoice(settled=False) for _ in range(5)]
+        await self.run_invoice_monitor()
+
+        data.settle_invoice(invoices[1])
+        data.settle_invoice(invoices[3])
+        notifications, open_indexes, settle_index = await self.run_invoice_monitor()
+        self.assertEqual(len(notifications), 2)
+        self.assertIn(invoices[1].memo, notifications[0])
+        self.assertIn(invoices[3].memo, notifications[1])
+        self.assertEqual(sorted(open_indexes), [invoices[0].add_index, invoices[2].add_index, invoices[4].add_index])
+        self.assertEqual(settle_index, 2)
+
+    async def test_invoice_added_and_settled_between_runs(self):
+        await self.run_invoice_monitor()
+        invoice = self.data.add_invoice(settled=True)
+
+        notifications, _, settle_index = await self.run_invoice_monitor()
+        self.assertEqual(len(notifications), 1)
+        self.assertIn(invoice.memo, notifications[0])
+        self.assertEqual(settle_index, invoice.settle_index)
+
+        notifications, _, _ = await self.run_invoice_monitor()
+        self.assertEqual(notifications, [])
+
+    async def test_payment_resolved_between_runs(self):
+        payment = self.data.add_payment(status=ln.Payment.IN_FLIGHT)
+        self.data.add_payment(status=ln.Payment.SUCCEEDED)
+        store = Store(self.store_path)
+        await sync_payments(self.stub, store, page_size=7)
+        self.assertEqual(store.get_cursor('payments'), payment.payment_index - 1)
+        store.close()
+
+        payment.status = ln.Payment.SUCCEEDED
+        store = Store(self.store_path)
+        await sync_payments(self.stub, store, page_size=7)
+        succeeded = [row['payment_hash'] for row in store.recent_payments(len(self.data.payments), ln.Payment.SUCCEEDED)]
+        self.assertIn(payment.payment_hash, succeeded)
+        self.assertEqual(store.get_cursor('payments'), len(self.data.payments))
+        store.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import time
+import asyncio
+from collections import OrderedDict
+
+CHAT_RATE = 0.5  # Tokens added per second to each chat's bucket
+CHAT_BURST = 3  # Taps a chat can make back to back before being throttled
+MAX_BUCKETS = 1000
+MAX_LAST_RESULTS = 16  # Keys whose last result is kept, least recently used dropped first
+
+
+class SingleFlight:
+    """Runs at most one computation per key at a time and shares its result.
+
+    Callers arriving while a computation is in flight await the same result.
+    The last result of the most recently used keys is kept so throttled
+    callers can be served it without starting a new computation.
+    """
+
+    def __init__(self, max_last=MAX_LAST_RESULTS):
+        self.max_last = max_last
+        self.coalesced = 0  # Calls that joined an in-flight computation
+        self.reused = 0  # Calls served the last result
+        self._in_flight = {}  # key -> Future
+        self._last = OrderedDict()  # key -> last result, least recently used first
+
+    async def do(self, key, fn, use_last=False):
+        if use_last and key in self._last:
+            self.reused += 1
+            self._last.move_to_end(key)
+            return self._last[key]
+        future = self._in_flight.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._run(key, fn))
+            self._in_flight[key] = future
+        else:
+            self.coalesced += 1
+        # Shield so one caller being cancelled doesn't cancel the others' result
+        return await asyncio.shield(future)
+
+    async def _run(self, key, fn):
+        try:
+            result = await fn()
+            self._last[key] = result
+            self._last.move_to_end(key)
+            if len(self._last) > self.max_last:
+                self._last.popitem(last=False)
+            return result
+        finally:
+            del self._in_flight[key]
+
+
+class RateLimiter:
+    """Token bucket per key (chat id), for at most MAX_BUCKETS keys."""
+
+    def __init__(self, rate=CHAT_RATE, burst=CHAT_BURST):
+        self.rate = rate
+        self.burst = burst
+        self.throttled = 0
+        self._buckets = OrderedDict()  # key -> (tokens, last refill time), least recently seen first
+
+    def allow(self, key):
+        now = time.monotonic()
+        tokens, updated = self._buckets.get(key, (self.burst, now))
+        tokens = min(self.burst, tokens + (now - updated) * self.rate)
+        allowed = tokens >= 1
+        if allowed:
+            tokens -= 1
+        else:
+            self.throttled += 1
+        self._buckets[key] = (tokens, now)
+        self._buckets.move_to_end(key)
+        if len(self._buckets) > MAX_BUCKETS:
+            # The chat seen longest ago goes first; it starts again from a full bucket
+            self._buckets.popitem(last=False)
+        return allowed
@@ -0,0 +1,41 @@
+from collections import Counter
+
+
+class ViewCache:
+    """Memoizes rendered views keyed by the version of the data they were rendered from.
+
+    One entry is kept per view key; rendering only happens when the version
+    differs from the one the cached text was built for.
+    """
+
+    def __init__(self):
+        self.hits = Counter()
+        self.misses = Counter()
+        self._entries = {}  # view -> (version, rendered)
+
+    def get(self, view, version, render):
+        entry = self._entries.get(view)
+        if entry is not None and entry[0] == version:
+            self.hits[view] += 1
+            return entry[1]
+        self.misses[view] += 1
+        rendered = render()
+        self._entries[view] = (version, rendered)
+        return rendered
+
+    def chunks(self, view, version, produce):
+        # Like get() for chunked views: on a miss the chunks are streamed as they
+        # are produced and only cached once all of them were consumed.
+        entry = self._entries.get(view)
+        if entry is not None and entry[0] == version:
+            self.hits[view] += 1
+            return iter(entry[1])
+        self.misses[view] += 1
+        return self._record(view, version, produce())
+
+    def _record(self, view, version, chunks):
+        rendered = []
+        for chunk in chunks:
+            rendered.append(chunk)
+            yield chunk
+        self._entries[view] = (version, rendered)